@@ -0,0 +1,28 @@
+from cfs import CFS
+from fcfs import FCFS
+from mlfq import MLFQ
+from multicore import MultiCore
+from priority import Priority
+from rr import RR
+from sjf import SJF, SRTF
+
+# Algorithm names as shown in the GUI, mapped to their scheduler classes
+ALGORITHMS = {
+    "FCFS": FCFS,
+    "RR": RR,
+    "Priority": Priority,
+    "SJF": SJF,
+    "SRTF": SRTF,
+    "MLFQ": MLFQ,
+    "CFS": CFS,
+    "MultiCore": MultiCore,
+}
+
+
+def create_scheduler(algorithm, **params):
+    """Instantiate the scheduler registered under `algorithm` with its keyword parameters."""
+    try:
+        scheduler_class = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}") from None
+    return scheduler_class(**params)
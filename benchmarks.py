@@ -0,0 +1,189 @@
+"""
+Scheduler throughput benchmarks: python -m benchmarks [options]
+
+Runs every algorithm on synthetic workloads of increasing size and reports
+processes/sec, slices/sec and peak traced memory. Results are written as JSON so
+runs from different commits can be compared with --compare.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from algorithms import create_scheduler
+from process import ProcessTable
+from scheduler import NON_PROCESS_SLICES
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_CASES = (("FCFS", {}), ("RR", {"quantum_time": 4}), ("Priority", {}),
+                 ("Priority", {"preemptive": True}), ("Priority", {"preemptive": True, "aging_interval": 50}))
+
+
+def uniform_workload(n, seed=0):
+    """Arrivals spread uniformly so the CPU is about 80% busy, bursts uniform in [1, 20]."""
+    rng = random.Random(seed)
+    horizon = int(n * 10.5 / 0.8)
+    arrivals = sorted(rng.randrange(horizon) for _ in range(n))
+    bursts = [rng.randint(1, 20) for _ in range(n)]
+    priorities = [rng.randint(0, 9) for _ in range(n)]
+    return ProcessTable([f"P{i}" for i in range(n)], arrivals, bursts, priorities)
+
+
+def bursty_workload(n, seed=0):
+    """Poisson arrivals in bursts: quiet stretches followed by floods of jobs."""
+    rng = random.Random(seed)
+    arrivals = []
+    current_time = 0.0
+    while len(arrivals) < n:
+        burst_rate = rng.choice((0.02, 0.5))  # Jobs per time unit for the next stretch
+        for _ in range(min(n - len(arrivals), rng.randint(10, 1000))):
+            current_time += rng.expovariate(burst_rate)
+            arrivals.append(int(current_time))
+    bursts = [rng.randint(1, 20) for _ in range(n)]
+    priorities = [rng.randint(0, 9) for _ in range(n)]
+    return ProcessTable([f"P{i}" for i in range(n)], arrivals, bursts, priorities)
+
+
+def heavy_tailed_workload(n, seed=0):
+    """Poisson arrivals with Pareto-distributed bursts (a few very long jobs)."""
+    rng = random.Random(seed)
+    bursts = [min(int(rng.paretovariate(1.5)), 100_000) for _ in range(n)]
+    mean_burst = sum(bursts) / n
+    arrivals = []
+    current_time = 0.0
+    for _ in range(n):
+        current_time += rng.expovariate(0.8 / mean_burst)
+        arrivals.append(int(current_time))
+    priorities = [rng.randint(0, 9) for _ in range(n)]
+    return ProcessTable([f"P{i}" for i in range(n)], arrivals, bursts, priorities)
+
+
+def many_priorities_workload(n, seed=0):
+    """Uniform arrivals with priorities spread over 10,000 levels."""
+    table = uniform_workload(n, seed)
+    rng = random.Random(seed + 1)
+    for i in range(n):
+        table.priority[i] = rng.randrange(10_000)
+    return table
+
+
+WORKLOADS = {
+    "uniform": uniform_workload,
+    "bursty": bursty_workload,
+    "heavy_tailed": heavy_tailed_workload,
+    "many_priorities": many_priorities_workload,
+}
+
+
+def case_label(algorithm, params):
+    if not params:
+        return algorithm
+    return algorithm + "(" + ",".join(f"{k}={v}" for k, v in params.items()) + ")"
+
+
+def measure(algorithm, params, table, trace_memory=True):
+    """Time one scheduling run, then repeat it under tracemalloc for the peak memory."""
+    start = time.perf_counter()
+    _, _, timeline = create_scheduler(algorithm, **params).run(table)
+    seconds = time.perf_counter() - start
+    slices = sum(1 for name, _, _ in timeline if name not in NON_PROCESS_SLICES)
+    del timeline
+
+    peak_bytes = None
+    if trace_memory:
+        tracemalloc.start()
+        create_scheduler(algorithm, **params).run(table)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "processes_per_sec": len(table) / seconds if seconds else None,
+        "slices": slices,
+        "slices_per_sec": slices / seconds if seconds else None,
+        "peak_memory_bytes": peak_bytes,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, workloads=tuple(WORKLOADS), cases=DEFAULT_CASES,
+                   trace_memory=True, seed=0, progress=None):
+    results = []
+    for workload in workloads:
+        for size in sizes:
+            table = WORKLOADS[workload](size, seed)
+            for algorithm, params in cases:
+                row = {"workload": workload, "size": size, "case": case_label(algorithm, params)}
+                row.update(measure(algorithm, params, table, trace_memory))
+                results.append(row)
+                if progress:
+                    progress(row)
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(baseline, current):
+    """Yield (workload, size, case, speedup) for cases present in both reports."""
+    previous = {(r["workload"], r["size"], r["case"]): r for r in baseline["results"]}
+    for row in current["results"]:
+        old = previous.get((row["workload"], row["size"], row["case"]))
+        if old and row["seconds"]:
+            yield row["workload"], row["size"], row["case"], old["seconds"] / row["seconds"]
+
+
+def print_row(row):
+    memory = f"{row['peak_memory_bytes'] / 2**20:10.1f} MiB" if row["peak_memory_bytes"] is not None else ""
+    print(f"{row['workload']:<16}{row['size']:>10}  {row['case']:<44}{row['processes_per_sec']:>14,.0f} proc/s"
+          f"{row['slices_per_sec']:>14,.0f} slices/s{memory}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the scheduling algorithms.")
+    parser.add_argument("--sizes", type=lambda s: [int(float(x)) for x in s.split(",")], default=list(DEFAULT_SIZES),
+                        help="comma-separated workload sizes, e.g. 1e3,1e5,1e7")
+    parser.add_argument("--workloads", type=lambda s: s.split(","), default=list(WORKLOADS),
+                        help=f"comma-separated subset of {', '.join(WORKLOADS)}")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="report speedups against an earlier results file")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(sorted(unknown))}")
+
+    report = run_benchmarks(args.sizes, args.workloads, trace_memory=not args.no_memory,
+                            seed=args.seed, progress=print_row)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for workload, size, case, speedup in compare(baseline, report):
+            print(f"{workload:<16}{size:>10}  {case:<44}{speedup:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
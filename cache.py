@@ -0,0 +1,155 @@
+import copy
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from process import process_columns
+from scheduler import ScheduleResult
+
+FINGERPRINT_VERSION = b"workload-v1"
+
+
+def _column_bytes(column):
+    if hasattr(column, "dtype"):
+        if column.dtype.kind in "iu":
+            return column.astype("<i8").tobytes()
+        return repr(column.tolist()).encode()
+    try:
+        return array("q", column).tobytes()
+    except (TypeError, OverflowError):
+        return repr(list(column)).encode()
+
+
+def workload_fingerprint(processes):
+    """
+    Hex digest identifying a workload: names, arrival, burst and priority columns in
+    order. A memory-mapped binary trace is identified by its file contents instead,
+    which is much faster than decoding every name.
+    """
+    hasher = hashlib.blake2b(FINGERPRINT_VERSION, digest_size=16)
+    path = getattr(processes, "path", None)
+    if path is not None:
+        hasher.update(b"binary-trace")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    names, arrivals, bursts, priorities = processes.columns() if hasattr(processes, "columns") \
+        else process_columns(processes)
+    hasher.update(len(names).to_bytes(8, "little"))
+    for name in names:
+        hasher.update(str(name).encode())
+        hasher.update(b"\0")
+    for column in (arrivals, bursts, priorities):
+        hasher.update(_column_bytes(column))
+    return hasher.hexdigest()
+
+
+def _params_digest(algorithm, params):
+    text = repr((algorithm, sorted(params.items())))
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+class ResultCache:
+    """
+    Memoizes scheduling results by (workload fingerprint, algorithm, parameters).
+
+    The in-memory tier is an LRU bounded to max_entries. With a directory, entries
+    are also pickled there and survive restarts; only point it at a directory you
+    trust, since loading a pickle can run code. ScheduleResults are stored without
+    their process list and re-attached to the caller's (identical) processes on a
+    hit, so later edits to those objects cannot leak into cached entries.
+    Call invalidate(fingerprint) when a workload changes to drop its entries.
+    """
+
+    def __init__(self, max_entries=64, directory=None, namespace="result"):
+        if max_entries < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.namespace = namespace  # Keeps different kinds of cached values apart on disk
+        self.entries = OrderedDict()  # (fingerprint, params digest) -> value, least recently used first
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, fingerprint, digest):
+        return os.path.join(self.directory, f"{self.namespace}-{fingerprint}-{digest}.pickle")
+
+    def get(self, fingerprint, algorithm, params, processes=None):
+        """Cached value or None; ScheduleResults are re-attached to `processes`."""
+        key = (fingerprint, _params_digest(algorithm, params))
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None:
+            try:
+                with open(self._path(*key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if isinstance(value, ScheduleResult):
+            value = copy.copy(value)
+            value.processes = processes
+        return value
+
+    def put(self, fingerprint, algorithm, params, value):
+        key = (fingerprint, _params_digest(algorithm, params))
+        if isinstance(value, ScheduleResult):
+            value = copy.copy(value)
+            value.processes = None
+            value.probe = None
+        self._remember(key, value)
+        if self.directory is not None:
+            # Write to a temporary file and rename, so concurrent readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path(*key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    def _remember(self, key, value):
+        if not self.max_entries:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, fingerprint):
+        """Drop every entry (all algorithms and parameters) for one workload."""
+        for key in [key for key in self.entries if key[0] == fingerprint]:
+            del self.entries[key]
+        if self.directory is not None:
+            for path in glob.glob(os.path.join(glob.escape(self.directory), f"{self.namespace}-{fingerprint}-*.pickle")):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        self.entries.clear()
+        if self.directory is not None:
+            for path in glob.glob(os.path.join(glob.escape(self.directory), f"{self.namespace}-*.pickle")):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,101 @@
+import heapq
+
+from scheduler import Scheduler
+
+NICE_0_WEIGHT = 1024
+# Linux's sched_prio_to_weight for nice -20..19: each level is worth ~25% CPU. Integer
+# weights keep total_weight exact however many processes come and go, so slices do not
+# depend on what ran earlier
+NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+VRUNTIME_SHIFT = 20  # Fixed-point fraction bits of vruntime
+
+
+class CFS(Scheduler):
+    show_priority = True
+
+    def __init__(self, sched_latency=24, min_granularity=3, switch_cost=0):
+        super().__init__(switch_cost)
+        if sched_latency <= 0 or min_granularity <= 0:
+            raise ValueError("Scheduling latency and minimum granularity must be positive")
+        self.sched_latency = sched_latency  # Period in which every runnable process should run once
+        self.min_granularity = min_granularity  # Shortest slice handed out
+
+    @staticmethod
+    def weight(priority):
+        """Load weight for a priority used as a nice level, clamped to nice -20..19."""
+        return NICE_WEIGHTS[min(max(priority, -20), 19) + 20]
+
+    def _engine(self, jobs, timeline):
+        """
+        Completely-Fair-Scheduler-style proportional sharing.
+        Runnable processes are ordered by virtual runtime in a heap (the kernel uses a
+        red-black tree); the one with the smallest vruntime runs for its weighted share
+        of sched_latency, at least min_granularity, and its vruntime advances by the
+        time it ran scaled by NICE_0_WEIGHT / weight, in integer fixed point so that
+        it is exact at any magnitude. Newcomers start at the current minimum vruntime
+        so they cannot monopolize the CPU; equal vruntimes go to the earlier arrival,
+        then the input order. Each slice costs O(log n).
+        """
+        sched_latency = self.sched_latency
+        min_granularity = self.min_granularity
+        weights = {}
+        vruntime_scale = NICE_0_WEIGHT << VRUNTIME_SHIFT
+
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        if pending is None:
+            return
+        tree = []  # (vruntime, arrival_time, index, [job, remaining_time, weight]) entries
+        total_weight = 0
+        min_vruntime = 0
+        current_time = pending[2]
+
+        def enqueue(job):
+            nonlocal total_weight
+            weight = weights.get(job[4])
+            if weight is None:
+                weight = weights[job[4]] = self.weight(job[4])
+            heapq.heappush(tree, (min_vruntime, job[2], job[0], [job, job[3], weight]))
+            total_weight += weight
+
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+            if not tree:
+                if pending is None:
+                    break
+                current_time = self._idle_until(current_time, pending[2], timeline)
+                continue
+
+            if probe is None:
+                vruntime, _, _, entry = heapq.heappop(tree)
+            else:
+                vruntime, _, _, entry = probe.timed("select", heapq.heappop, tree)
+            job, remaining, weight = entry
+            time_slice = max(min_granularity, sched_latency * weight // total_weight)
+            ran = min(remaining, time_slice)
+            start_time = current_time = self._context_switch(job, current_time, timeline)
+            current_time += ran
+            self.current_time = current_time
+            if timeline is not None:
+                if timeline and timeline[-1][0] == job[1] and timeline[-1][2] == start_time:
+                    # Picked again right away; extend the previous slice
+                    start_time = timeline.pop()[1]
+                timeline.append((job[1], start_time, current_time))
+
+            entry[1] = remaining = remaining - ran
+            vruntime += ran * vruntime_scale // weight
+            if remaining == 0:
+                total_weight -= weight
+                min_vruntime = max(min_vruntime, tree[0][0] if tree else vruntime)
+                yield job, current_time
+            else:
+                heapq.heappush(tree, (vruntime, job[2], job[0], entry))
+                if probe is not None:
+                    probe.counters["enqueues"] += 1
+                min_vruntime = max(min_vruntime, tree[0][0])
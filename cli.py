@@ -0,0 +1,239 @@
+"""
+Headless command-line entry point: python -m cli TRACE [options]
+
+Only the scheduling modules are imported at startup; matplotlib is loaded when a
+chart is requested and tkinter never is, so batch runs start quickly.
+"""
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+
+from algorithms import ALGORITHMS, create_scheduler
+from instrumentation import Instrumentation
+from process import ProcessTable
+from scheduler import format_stats
+from traces import is_binary_trace, open_binary_trace, read_trace
+
+# Modules that must never be pulled in by a headless run
+HEAVY_MODULES = ("tkinter", "matplotlib", "numpy")
+DEFAULT_STARTUP_BUDGET_MS = 150
+
+
+def load_trace(path):
+    """Load a CSV, JSONL or binary trace as a ProcessTable."""
+    if is_binary_trace(path):
+        return open_binary_trace(path)
+    table = ProcessTable()
+    for process in read_trace(path):
+        table.append(process.name, process.arrival_time, process.burst_time, process.priority)
+    return table
+
+
+def scheduler_params(args):
+    params = {"switch_cost": args.switch_cost}
+    if args.algorithm == "RR":
+        params["quantum_time"] = args.quantum
+    elif args.algorithm == "Priority":
+        params["preemptive"] = args.preemptive
+        params["aging_interval"] = args.aging
+    elif args.algorithm == "MLFQ":
+        params["quanta"] = args.mlfq_quanta
+        params["boost_interval"] = args.boost
+    elif args.algorithm == "CFS":
+        params["sched_latency"] = args.sched_latency
+        params["min_granularity"] = args.min_granularity
+    elif args.algorithm == "MultiCore":
+        params["cores"] = args.cores
+        params["discipline"] = args.discipline
+        params["quantum_time"] = args.quantum
+        params["queue_mode"] = args.queue_mode
+        params["migration_cost"] = args.migration_cost
+    return params
+
+
+def build_scheduler(args):
+    return create_scheduler(args.algorithm, **scheduler_params(args))
+
+
+def summary(algorithm, count, avg_waiting_time, avg_turnaround_time, makespan, context_switches, switch_time):
+    return {
+        "algorithm": algorithm,
+        "processes": count,
+        "avg_waiting_time": avg_waiting_time,
+        "avg_turnaround_time": avg_turnaround_time,
+        "makespan": makespan,
+        "context_switches": context_switches,
+        "switch_time": switch_time,
+    }
+
+
+def write_output(path, metrics, result=None):
+    """Write the summary as JSON, or per-process rows as CSV when the path ends in .csv."""
+    if path.endswith(".csv"):
+        if result is None:
+            raise SystemExit("Per-process CSV output is not available in --stream mode")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("name", "arrival_time", "burst_time", "priority",
+                             "completion_time", "waiting_time", "turnaround_time", "response_time"))
+            for i in result.finish_order:
+                process = result.processes[i]
+                writer.writerow((process.name, process.arrival_time, process.burst_time, process.priority,
+                                 result.completion_times[i], result.waiting_times[i], result.turnaround_times[i],
+                                 result.response_times[i]))
+    else:
+        with open(path, "w") as f:
+            json.dump(metrics, f, indent=2)
+            f.write("\n")
+
+
+def save_chart(path, timeline):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from gantt import draw_gantt
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    draw_gantt(ax, timeline)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def check_startup(budget_ms):
+    """Import this module under -X importtime and fail if it is over budget or loads a GUI/plotting library."""
+    # Run next to this file so "import cli" finds it wherever the check is started from
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import cli"],
+                          capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        print(f"Startup check failed: could not import cli ({error[-1] if error else f'exit code {proc.returncode}'})")
+        return 1
+    total_us = 0
+    heavy = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, package = line[len("import time:"):].split("|")
+        name = package.strip()
+        if name.split(".")[0] in HEAVY_MODULES:
+            heavy.add(name.split(".")[0])
+        if not package.startswith("  "):  # Top-level imports only; nested ones are already included
+            total_us += int(cumulative)
+
+    print(f"Startup import time: {total_us / 1000:.1f} ms (budget {budget_ms} ms)")
+    if heavy:
+        print(f"Heavy modules imported at startup: {', '.join(sorted(heavy))}")
+    return 0 if total_us <= budget_ms * 1000 and not heavy else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Run a CPU scheduling algorithm on a process trace.")
+    parser.add_argument("trace", nargs="?", help="CSV, JSONL or binary trace file")
+    parser.add_argument("-a", "--algorithm", choices=list(ALGORITHMS), default="FCFS")
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="time quantum for RR")
+    parser.add_argument("--preemptive", action="store_true", help="preemptive Priority scheduling")
+    parser.add_argument("--aging", type=int, default=None, help="Priority aging interval")
+    parser.add_argument("--mlfq-quanta", type=lambda s: tuple(int(x) for x in s.split(",")), default=(2, 4, 8),
+                        metavar="Q0,Q1,...", help="per-level time quanta for MLFQ, highest priority first")
+    parser.add_argument("--boost", type=int, default=None, help="MLFQ priority boost interval")
+    parser.add_argument("--sched-latency", type=int, default=24, help="CFS target scheduling latency")
+    parser.add_argument("--min-granularity", type=int, default=3, help="CFS minimum time slice")
+    parser.add_argument("--cores", type=int, default=2, help="CPU count for MultiCore")
+    parser.add_argument("--discipline", choices=("FCFS", "RR", "Priority"), default="FCFS",
+                        help="ready-queue order for MultiCore")
+    parser.add_argument("--queue-mode", choices=("global", "per-core"), default="global",
+                        help="MultiCore ready queues: one shared queue, or per-core queues with work stealing")
+    parser.add_argument("--switch-cost", type=int, default=0, help="time units lost per context switch")
+    parser.add_argument("--migration-cost", type=int, default=0,
+                        help="cache warmup time when MultiCore resumes a process on another core")
+    parser.add_argument("--table", action="store_true", help="print the per-process table")
+    parser.add_argument("-o", "--output", help="write metrics to a .json file (or per-process rows to .csv)")
+    parser.add_argument("--chart", help="save a Gantt chart image (loads matplotlib)")
+    parser.add_argument("--stream", action="store_true",
+                        help="schedule an arrival-sorted trace incrementally with bounded memory")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="reuse results of earlier runs on the same trace and settings from this directory")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write engine counters and timers (dispatches, queue ops, selection, formatting) as JSON")
+    parser.add_argument("--trace-events", metavar="PATH",
+                        help="write the run as a Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument("--check-startup", nargs="?", type=float, const=DEFAULT_STARTUP_BUDGET_MS,
+                        metavar="BUDGET_MS", help="check this entry point's import time against a budget and exit")
+    args = parser.parse_args(argv)
+
+    if args.check_startup is not None:
+        return check_startup(args.check_startup)
+    if not args.trace:
+        parser.error("a trace file is required")
+
+    scheduler = build_scheduler(args)
+    if args.profile or args.trace_events:
+        scheduler.probe = Instrumentation(record_slices=bool(args.trace_events))
+    result = None
+    if args.stream:
+        if args.table or args.chart:
+            parser.error("--table and --chart need the full schedule and cannot be used with --stream")
+        processes = open_binary_trace(args.trace) if is_binary_trace(args.trace) else read_trace(args.trace)
+        for _ in scheduler.stream(processes):
+            pass
+        stats = scheduler.stats
+        metrics = summary(args.algorithm, stats.count, stats.avg_waiting_time,
+                          stats.avg_turnaround_time, stats.makespan,
+                          scheduler.context_switches, scheduler.switch_time)
+    else:
+        processes = load_trace(args.trace)
+        if args.cache_dir and scheduler.probe is None:
+            from cache import ResultCache, workload_fingerprint
+
+            cache = ResultCache(max_entries=0, directory=args.cache_dir)
+            fingerprint = workload_fingerprint(processes)
+            params = scheduler_params(args)
+            result = cache.get(fingerprint, args.algorithm, params, processes)
+            if result is None:
+                result = scheduler.schedule(processes)
+                cache.put(fingerprint, args.algorithm, params, result)
+        else:
+            result = scheduler.schedule(processes)
+        stats = result.stats
+        metrics = summary(args.algorithm, len(result), result.avg_waiting_time,
+                          result.avg_turnaround_time, max(result.completion_times, default=0),
+                          result.context_switches, result.switch_time)
+        if hasattr(result, "utilization"):
+            metrics["cores"] = result.cores
+            metrics["migrations"] = result.migrations
+            metrics["migration_time"] = result.migration_time
+            metrics["core_utilization"] = result.utilization
+        if args.table:
+            print(result.format())
+    metrics.update(stats.to_dict())
+
+    if not args.table:
+        print(f"Processes: {metrics['processes']}")
+        print(f"Average Waiting Time: {metrics['avg_waiting_time']:.2f}")
+        print(f"Average Turnaround Time: {metrics['avg_turnaround_time']:.2f}")
+        print(f"Context Switches: {metrics['context_switches']} ({metrics['switch_time']} time units lost)")
+        print(f"Makespan: {metrics['makespan']}")
+        if "core_utilization" in metrics:
+            utilization = metrics["core_utilization"]
+            print(f"Migrations: {metrics['migrations']} ({metrics['migration_time']} time units of cache warmup)")
+            print(f"Core Utilization: avg {sum(utilization) / len(utilization):.1%}, "
+                  f"min {min(utilization):.1%}, max {max(utilization):.1%}")
+        print(format_stats(stats), end="")
+    if args.output:
+        write_output(args.output, metrics, result)
+    if args.chart:
+        save_chart(args.chart, result.timeline)
+    if args.profile:
+        scheduler.probe.write_json(args.profile)
+    if args.trace_events:
+        scheduler.probe.write_chrome_trace(args.trace_events)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,37 +1,65 @@
-class FCFS:
-    def __init__(self):
-        self.current_time = 0
-        self.total_waiting_time = 0
-        self.total_turnaround_time = 0
-    
-    def schedule(self, processes):
-        if not processes:
-            return "No processes to schedule"
-        
-        processes.sort(key=lambda x: x.arrival_time)
-        
-        scheduling_output = f"{'Process ID':^12}{'Arrival Time':^15}{'Burst Time':^12}{'Waiting Time':^15}{'Turnaround Time':^17}\n"
-        scheduling_output += "-" * 71 + "\n"
-        
-        for process in processes:
-            
-            if self.current_time < process.arrival_time:
-                self.current_time = process.arrival_time
-            
-            waiting_time = self.current_time - process.arrival_time
-            self.total_waiting_time += waiting_time
-            
-            turnaround_time = waiting_time + process.burst_time
-            self.total_turnaround_time += turnaround_time
-            
-            scheduling_output += f"{process.name:^12}{process.arrival_time:^15}{process.burst_time:^12}{waiting_time:^15}{turnaround_time:^17}\n"
-            
-            self.current_time += process.burst_time
-        
-        avg_waiting_time = self.total_waiting_time / len(processes)
-        avg_turnaround_time = self.total_turnaround_time / len(processes)
-        
-        scheduling_output += f"\nAverage Waiting Time: {avg_waiting_time:.2f}\n"
-        scheduling_output += f"Average Turnaround Time: {avg_turnaround_time:.2f}\n"
-        
-        return scheduling_output
\ No newline at end of file
+from scheduler import Scheduler
+
+
+class FCFS(Scheduler):
+    def _engine(self, jobs, timeline):
+        """Serve jobs in arrival order (ties keep their input order)."""
+        current_time = 0
+        started = False
+        if self._resume is not None:
+            # Waiting jobs come first in the input, so no queue needs restoring
+            current_time = self._resume[0]
+            started = True
+        next_checkpoint = self._next_checkpoint
+
+        for job in jobs:
+            arrival_time = job[2]
+            if current_time < arrival_time:
+                if started:
+                    current_time = self._idle_until(current_time, arrival_time, timeline)
+                else:
+                    current_time = arrival_time
+            started = True
+
+            if current_time >= next_checkpoint:
+                next_checkpoint = self._checkpoint(current_time, timeline, None)
+            start_time = current_time = self._context_switch(job, current_time, timeline)
+            current_time += job[3]
+            self.current_time = current_time
+            if timeline is not None:
+                timeline.append((job[1], start_time, current_time))
+            yield job, current_time
+
+
+def fcfs_arrays(arrival_times, burst_times):
+    """
+    Vectorized FCFS over NumPy arrays for bulk workloads.
+    With processes in arrival order, completion[i] = max(completion[i-1], arrival[i]) + burst[i],
+    which unrolls to cumsum(burst) + running max of (arrival - work queued before it).
+    Returns (completion_times, waiting_times, turnaround_times) aligned with the input
+    order; the metrics are identical to FCFS.schedule.
+    """
+    import numpy as np
+
+    arrival_times = np.asarray(arrival_times, dtype=np.int64)
+    burst_times = np.asarray(burst_times, dtype=np.int64)
+    if np.all(arrival_times[1:] >= arrival_times[:-1]):
+        # Traces are usually already in arrival order; skip the sort and the scatter
+        order = None
+        arrivals, bursts = arrival_times, burst_times
+    else:
+        order = np.argsort(arrival_times, kind="stable")
+        arrivals, bursts = arrival_times[order], burst_times[order]
+
+    work_done = np.cumsum(bursts)
+    # The CPU starts at time 0, so idle shifts are never negative
+    idle_shift = np.maximum.accumulate(np.maximum(arrivals - (work_done - bursts), 0))
+
+    if order is None:
+        completion_times = work_done + idle_shift
+    else:
+        completion_times = np.empty_like(work_done)
+        completion_times[order] = work_done + idle_shift
+    turnaround_times = completion_times - arrival_times
+    waiting_times = turnaround_times - burst_times
+    return completion_times, waiting_times, turnaround_times
@@ -0,0 +1,185 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+
+from scheduler import NON_PROCESS_SLICES
+
+MAX_LABELED_ROWS = 40  # Beyond this, y tick labels and the legend are unreadable anyway
+PALETTE = plt.get_cmap('tab10')  # Row colors cycle through it
+# Path codes of one closed rectangle
+RECTANGLE_CODES = np.array([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY], dtype=Path.code_type)
+
+
+def merge_slices(starts, ends, resolution, rows=None):
+    """
+    Merge consecutive slices separated by gaps narrower than `resolution` (one pixel in data units).
+    With `rows`, slices must be grouped by row and are only merged within one; returns
+    (starts, ends) or, with rows, (starts, ends, rows).
+    """
+    if len(starts) < 2 or resolution <= 0:
+        return (starts, ends) if rows is None else (starts, ends, rows)
+    gaps = starts[1:] - ends[:-1] >= resolution
+    if rows is not None:
+        gaps |= rows[1:] != rows[:-1]
+    breaks = np.flatnonzero(gaps)
+    firsts = np.concatenate(([0], breaks + 1))
+    merged = starts[firsts], ends[np.concatenate((breaks, [len(ends) - 1]))]
+    return merged if rows is None else merged + (rows[firsts],)
+
+
+class GanttChart:
+    """
+    Gantt renderer that draws every slice through a single collection artist
+    instead of one barh artist per slice: one compound path per palette color,
+    built with array operations rather than one Path object per rectangle. Whenever the view changes (zoom/pan, or new
+    slices widening it), only the slices inside it are rebuilt, with slices of a row
+    closer together than a pixel merged, so the number of drawn rectangles per row
+    stays bounded by the axes width instead of the timeline length.
+
+    Slices live in flat, growable NumPy buffers (start, end, row) in the order they
+    were added, so extend() costs O(new slices) plus one vectorized refresh, and a
+    chart fed a timeline chunk by chunk stays close to the cost of drawing it once.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.names = []
+        self.colors = []
+        self.collections = []
+        self._row_index = {}  # Process name -> row
+        self._starts = np.empty(0)
+        self._ends = np.empty(0)
+        self._rows = np.empty(0, dtype=np.int64)
+        self._count = 0  # Slices stored; the buffers past it are spare capacity
+        self._span = None  # (earliest start, latest end) over all slices
+        self._callback_ids = []
+
+    def draw(self, timeline, title="Gantt Chart"):
+        """Replace the chart with a (name, start, end) timeline, one row per process in order of first execution."""
+        ax = self.ax
+        for callback_id in self._callback_ids:
+            ax.callbacks.disconnect(callback_id)
+        ax.clear()
+        self.__init__(ax)
+
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Processes')
+        ax.set_title(title)
+        ax.grid(True, axis='x', alpha=0.3)
+        ax.invert_yaxis()
+        self.extend(timeline)
+        self._callback_ids = [ax.callbacks.connect('xlim_changed', self.refresh),
+                               ax.callbacks.connect('ylim_changed', self.refresh)]
+        return self
+
+    def extend(self, slices):
+        """Append newly scheduled (name, start, end) slices and redraw the view once."""
+        row_index = self._row_index
+        names = self.names
+        new_starts, new_ends, new_rows = [], [], []
+        for name, start_time, end_time in slices:
+            if name in NON_PROCESS_SLICES:
+                continue
+            row = row_index.get(name)
+            if row is None:
+                row = row_index[name] = len(names)
+                names.append(name)
+            new_starts.append(start_time)
+            new_ends.append(end_time)
+            new_rows.append(row)
+        if not new_rows:
+            return self
+
+        count = self._count
+        total = count + len(new_rows)
+        if total > len(self._starts):
+            # Grow geometrically so appending stays amortized O(1) per slice
+            capacity = max(total, 2 * len(self._starts), 1024)
+            for attribute in ("_starts", "_ends", "_rows"):
+                old = getattr(self, attribute)
+                grown = np.empty(capacity, dtype=old.dtype)
+                grown[:count] = old[:count]
+                setattr(self, attribute, grown)
+        self._starts[count:total] = new_starts
+        self._ends[count:total] = new_ends
+        self._rows[count:total] = new_rows
+        self._count = total
+        first, last = min(new_starts), max(new_ends)
+        if self._span is not None:
+            first, last = min(first, self._span[0]), max(last, self._span[1])
+        self._span = first, last
+
+        ax = self.ax
+        if len(self.colors) < len(names):
+            self.colors.extend(PALETTE(i % PALETTE.N) for i in range(len(self.colors), len(names)))
+            ax.set_ylim(len(names) - 0.5, -0.5, emit=False)
+            if len(names) <= MAX_LABELED_ROWS:
+                ax.set_yticks(range(len(names)))
+                ax.set_yticklabels([f'Process {name}' for name in names])
+                handles = [plt.Rectangle((0, 0), 1, 1, color=color) for color in self.colors]
+                ax.legend(handles, [f'Process {name}' for name in names],
+                          loc='upper right', bbox_to_anchor=(1.15, 1))
+            else:
+                ax.set_yticks([])
+                legend = ax.get_legend()
+                if legend is not None:
+                    legend.remove()
+
+        # Widen the view without the limit callbacks; the refresh below covers it
+        ax.set_xlim(first, last if last > first else first + 1, emit=False)
+        self.refresh()
+        return self
+
+    def refresh(self, ax=None):
+        """Redraw the slices in the current view as one PolyCollection, merging sub-pixel gaps."""
+        ax = self.ax
+        for collection in self.collections:
+            collection.remove()
+        self.collections = []
+
+        count = self._count
+        if not count:
+            return
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = sorted(ax.get_ylim())
+        width_pixels = max(ax.get_window_extent().width, 1)
+        resolution = (x_max - x_min) / width_pixels
+
+        starts, ends, rows = self._starts[:count], self._ends[:count], self._rows[:count]
+        # Bars span row - 0.4 .. row + 0.4; rows scrolled out of view are skipped too
+        visible = (ends >= x_min) & (starts <= x_max) & (rows > y_min - 0.4) & (rows < y_max + 0.4)
+        if not visible.all():
+            visible = np.flatnonzero(visible)
+            if not len(visible):
+                return
+            starts, ends, rows = starts[visible], ends[visible], rows[visible]
+        # Group by row; slices of one row were added in time order, which the stable sort keeps
+        order = np.argsort(rows, kind='stable')
+        starts, ends, rows = merge_slices(starts[order], ends[order], resolution, rows[order])
+
+        # One compound path of rectangles per palette color
+        colors = rows % PALETTE.N
+        order = np.argsort(colors, kind='stable')
+        starts, ends, rows, colors = starts[order], ends[order], rows[order], colors[order]
+        bottoms = rows - 0.4
+        tops = bottoms + 0.8
+        vertices = np.stack((np.column_stack((starts, bottoms)), np.column_stack((starts, tops)),
+                             np.column_stack((ends, tops)), np.column_stack((ends, bottoms)),
+                             np.column_stack((starts, bottoms))), axis=1)
+        bounds = np.flatnonzero(np.diff(colors)) + 1
+        paths, facecolors = [], []
+        for first, last in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(colors)]))):
+            paths.append(Path(vertices[first:last].reshape(-1, 2), np.tile(RECTANGLE_CODES, last - first)))
+            facecolors.append(PALETTE(colors[first]))
+        # Outlines only help while individual slices are wide enough to see
+        linewidth = 0.5 if len(starts) <= width_pixels else 0
+        collection = PathCollection(paths, facecolors=facecolors, edgecolors='black',
+                                    linewidths=linewidth, alpha=0.7)
+        ax.add_collection(collection, autolim=False)
+        self.collections.append(collection)
+
+
+def draw_gantt(ax, timeline, title="Gantt Chart"):
+    """Draw a (name, start, end) timeline on ax, one row per process in order of first execution."""
+    return GanttChart(ax).draw(timeline, title)
@@ -1,14 +1,84 @@
 import os
+import queue
+import threading
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from algorithms import create_scheduler
+from cache import ResultCache, workload_fingerprint
+from gantt import GanttChart
+from incremental import IncrementalScheduler
+from scheduler import ScheduleCancelled
 from process import Process
-from fcfs import FCFS
-from rr import RR
-from priority import Priority
+
+# Process rows shown in the results text; the summary below them always covers every process
+OUTPUT_ROWS = 1000
+
+class VirtualListbox(ttk.Frame):
+    """Listbox over a (possibly huge) sequence that only materializes the visible rows."""
+
+    def __init__(self, master, items, format_row, height=5):
+        super().__init__(master)
+        self.items = items
+        self.format_row = format_row  # (index, item) -> row text
+        self.height = height
+        self.first = 0  # Index of the first visible row
+        self.selected = None  # Selected index into items
+
+        self.listbox = tk.Listbox(self, height=height, exportselection=False)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox.pack(side="left", fill="x", expand=True)
+        self.listbox.bind('<<ListboxSelect>>', self.on_select)
+        self.listbox.bind('<MouseWheel>', lambda e: self.scroll_to(self.first - (1 if e.delta > 0 else -1)))
+        self.listbox.bind('<Button-4>', lambda e: self.scroll_to(self.first - 1))
+        self.listbox.bind('<Button-5>', lambda e: self.scroll_to(self.first + 1))
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = self.height if unit == "pages" else 1
+            self.scroll_to(self.first + int(amount) * step)
+
+    def scroll_to(self, first):
+        self.first = max(0, min(first, len(self.items) - self.height))
+        self.refresh()
+        return "break"
+
+    def refresh(self):
+        """Repaint only the visible rows."""
+        count = len(self.items)
+        self.first = max(0, min(self.first, count - self.height))
+        last = min(count, self.first + self.height)
+        self.listbox.delete(0, tk.END)
+        rows = [self.format_row(i, self.items[i]) for i in range(self.first, last)]
+        if rows:
+            self.listbox.insert(tk.END, *rows)
+        if self.selected is not None and self.first <= self.selected < last:
+            self.listbox.selection_set(self.selected - self.first)
+        if count:
+            self.scrollbar.set(self.first / count, last / count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def on_select(self, event):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.first + selection[0]
+            self.event_generate('<<ListboxSelect>>')
+
+    def curselection(self):
+        if self.selected is not None and self.selected < len(self.items):
+            return (self.selected,)
+        return ()
+
+    def clear_selection(self):
+        self.selected = None
+        self.listbox.selection_clear(0, tk.END)
+
 
 class SchedulerGUI:
     def __init__(self, master):
@@ -19,8 +89,16 @@ class SchedulerGUI:
         
         # Initialize variables
         self.processes = []
+        self.incremental_schedulers = {}  # (algorithm, params) -> IncrementalScheduler
+        self.result_cache = ResultCache(max_entries=32)
+        self.fingerprint = None  # Fingerprint of self.processes, computed on demand
+        self.shown_result = None  # (fingerprint, algorithm, params) currently in the output and chart
+        self.worker = None  # Background scheduling thread while a run is in progress
+        self.worker_queue = queue.Queue()
+        self.cancel_event = threading.Event()
         self.selected_algorithm = tk.StringVar(value="FCFS")
         self.quantum_time = tk.IntVar(value=2)
+        self.switch_cost = tk.IntVar(value=0)
         
         # Create the main UI
         self.create_widgets()
@@ -33,7 +111,7 @@ class SchedulerGUI:
         self.process_frame.pack(padx=10, pady=5, fill="x")
         
         # Process List
-        self.process_listbox = tk.Listbox(self.process_frame, height=5)
+        self.process_listbox = VirtualListbox(self.process_frame, self.processes, self.format_process_row, height=5)
         self.process_listbox.pack(padx=5, pady=5, fill="x")
         self.process_listbox.bind('<<ListboxSelect>>', self.on_process_selected)
         
@@ -41,8 +119,10 @@ class SchedulerGUI:
         btn_frame = ttk.Frame(self.process_frame)
         btn_frame.pack(fill="x", padx=5)
         
-        ttk.Button(btn_frame, text="Remove Process", command=self.remove_process).pack(side="left", padx=5)
-        ttk.Button(btn_frame, text="Edit Process", command=self.edit_process).pack(side="left", padx=5)
+        self.remove_button = ttk.Button(btn_frame, text="Remove Process", command=self.remove_process)
+        self.remove_button.pack(side="left", padx=5)
+        self.edit_button = ttk.Button(btn_frame, text="Edit Process", command=self.edit_process)
+        self.edit_button.pack(side="left", padx=5)
         
         # Process Input Frame
         input_frame = ttk.Frame(self.process_frame)
@@ -58,7 +138,8 @@ class SchedulerGUI:
             entry.grid(row=1, column=i, padx=5, pady=5)
             self.entries[label.lower().replace(" ", "_")] = entry
         
-        ttk.Button(input_frame, text="Add Process", command=self.add_process).grid(row=1, column=len(labels), padx=5)
+        self.add_button = ttk.Button(input_frame, text="Add Process", command=self.add_process)
+        self.add_button.grid(row=1, column=len(labels), padx=5)
         
         # Algorithm Selection Frame
         self.algorithm_frame = ttk.LabelFrame(self.master, text="Algorithm Selection")
@@ -69,10 +150,16 @@ class SchedulerGUI:
         algo_frame.pack(fill="x", padx=5, pady=5)
         
         ttk.Label(algo_frame, text="Select Algorithm:").pack(side="left", padx=5)
-        self.algorithm_combo = ttk.Combobox(algo_frame, values=["FCFS", "RR", "Priority"], 
+        self.algorithm_combo = ttk.Combobox(algo_frame, values=["FCFS", "RR", "Priority", "SJF", "SRTF", "MLFQ", "CFS"], 
                                           textvariable=self.selected_algorithm, state="readonly")
         self.algorithm_combo.pack(side="left", padx=5)
         self.algorithm_combo.bind("<<ComboboxSelected>>", self.on_algorithm_selected)
+
+        # Context switch cost applies to every algorithm
+        ttk.Label(algo_frame, text="Context Switch Cost:").pack(side="left", padx=5)
+        self.switch_cost_entry = ttk.Entry(algo_frame, textvariable=self.switch_cost,
+                                           width=10, justify='center')
+        self.switch_cost_entry.pack(side="left", padx=5)
         
         # Quantum Time Entry
         self.quantum_frame = ttk.Frame(self.algorithm_frame)
@@ -83,9 +170,17 @@ class SchedulerGUI:
                                      width=10, justify='center')
         self.quantum_entry.pack(side="left", padx=5)
         
-        # Schedule Button
-        ttk.Button(self.master, text="Schedule Processes", 
-                  command=self.schedule_processes).pack(pady=10)
+        # Schedule Button, progress bar and Cancel Button
+        run_frame = ttk.Frame(self.master)
+        run_frame.pack(pady=10)
+        self.schedule_button = ttk.Button(run_frame, text="Schedule Processes",
+                                          command=self.schedule_processes)
+        self.schedule_button.pack(side="left", padx=5)
+        self.progress_bar = ttk.Progressbar(run_frame, length=250, mode="determinate")
+        self.progress_bar.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(run_frame, text="Cancel", command=self.cancel_scheduling,
+                                        state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
         
         # Output Frame
         self.output_frame = ttk.LabelFrame(self.master, text="Scheduling Results")
@@ -98,6 +193,7 @@ class SchedulerGUI:
         # Gantt Chart Frame
         self.gantt_frame = ttk.LabelFrame(self.master, text="Gantt Chart")
         self.gantt_frame.pack(padx=10, pady=5, fill="both", expand=True)
+        self.gantt_canvas = None  # Created on the first run and reused afterwards
         
     def add_process(self):
         """Add a new process to the list."""
@@ -112,6 +208,7 @@ class SchedulerGUI:
                 
             process = Process(name, arrival_time, burst_time, priority)
             self.processes.append(process)
+            self.processes_changed(arrival_time)
             self.update_process_listbox()
             
             # Clear entries
@@ -125,7 +222,9 @@ class SchedulerGUI:
         """Remove the selected process from the list."""
         selected = self.process_listbox.curselection()
         if selected:
-            del self.processes[selected[0]]
+            removed = self.processes.pop(selected[0])
+            self.process_listbox.clear_selection()
+            self.processes_changed(removed.arrival_time)
             self.update_process_listbox()
             
     def edit_process(self):
@@ -144,6 +243,7 @@ class SchedulerGUI:
             if not name or arrival_time < 0 or burst_time <= 0 or priority < 0:
                 raise ValueError("Invalid input values")
                 
+            self.processes_changed(process.arrival_time, arrival_time)
             process.name = name
             process.arrival_time = arrival_time
             process.burst_time = burst_time
@@ -155,11 +255,22 @@ class SchedulerGUI:
             messagebox.showerror("Input Error", "Please enter valid numeric values")
             
     def update_process_listbox(self):
-        """Update the process listbox display."""
-        self.process_listbox.delete(0, tk.END)
-        for i, process in enumerate(self.processes, 1):
-            self.process_listbox.insert(tk.END, 
-                f"P{i}: {process.name} (Arrival: {process.arrival_time}, Burst: {process.burst_time}, Priority: {process.priority})")
+        """Update the process listbox display (only the visible rows are repainted)."""
+        self.process_listbox.refresh()
+
+    @staticmethod
+    def format_process_row(i, process):
+        return f"P{i + 1}: {process.name} (Arrival: {process.arrival_time}, Burst: {process.burst_time}, Priority: {process.priority})"
+
+    def processes_changed(self, *arrival_times):
+        """Tell the cached schedules which arrival times an add/edit/remove touched."""
+        for incremental in self.incremental_schedulers.values():
+            incremental.process_changed(*arrival_times)
+        # Results for the workload as it was before this change are no longer needed
+        if self.fingerprint is not None:
+            self.result_cache.invalidate(self.fingerprint)
+            self.fingerprint = None
+        self.shown_result = None
             
     def on_process_selected(self, event):
         """Handle process selection from the listbox."""
@@ -195,165 +306,144 @@ class SchedulerGUI:
         self.output_text.configure(state="normal")
         self.output_text.delete("1.0", tk.END)  # Clear the text widget
         
-        # Create the appropriate scheduler instance
-        if algorithm == "FCFS":
-            scheduler = FCFS()
-        elif algorithm == "RR":
-            quantum = self.quantum_time.get()  # Get the quantum time from the entry
-            scheduler = RR(quantum)  # Pass the quantum to the RR scheduler
-        elif algorithm == "Priority":
-            scheduler = Priority()
-        else:
+        # Collect the parameters for the selected scheduler
+        if algorithm not in self.algorithm_combo.cget("values"):
             self.output_text.insert(tk.END, "Selected algorithm is not implemented.")
             self.output_text.configure(state="disabled")
             return
-        
-        # Get the scheduling output
-        scheduling_output = scheduler.schedule(self.processes)
-        self.output_text.insert(tk.END, scheduling_output)
+        params = {"switch_cost": self.switch_cost.get()}
+        if algorithm == "RR":
+            params["quantum_time"] = self.quantum_time.get()  # Get the quantum time from the entry
+
+        # Same workload and settings as an earlier run: show the cached result without rescheduling
+        if self.fingerprint is None:
+            self.fingerprint = workload_fingerprint(self.processes)
+        cache_key = (self.fingerprint, algorithm, params)
+        result = self.result_cache.get(self.fingerprint, algorithm, params, self.processes)
+        if result is not None:
+            # Capped like a fresh run's output, so large cached results do not stall the window
+            self.output_text.insert(tk.END, result.format(OUTPUT_ROWS))
+            self.output_text.configure(state="disabled")
+            if self.shown_result != cache_key:  # The chart on screen is already this one otherwise
+                self.plot_gantt_chart(result.timeline, f"{algorithm} Gantt Chart")
+                self.shown_result = cache_key
+            return
+
+        # Reuse the previous schedule for this configuration and only redo what the edits touched
+        key = (algorithm,) + tuple(sorted(params.items()))
+        incremental = self.incremental_schedulers.get(key)
+        if incremental is None:
+            incremental = self.incremental_schedulers[key] = IncrementalScheduler(
+                lambda: create_scheduler(algorithm, **params))
+
+        self.output_text.insert(tk.END, "Scheduling...")
         self.output_text.configure(state="disabled")
+        self.set_running(True)
+        self.progress_bar.configure(value=0, maximum=max(len(self.processes), 1))
+        self.plot_gantt_chart([], f"{algorithm} Gantt Chart")
+        self.shown_result = None
+        self.charted_slices = 0
 
-        # Plot the Gantt chart after scheduling, passing the scheduler instance
-        self.plot_gantt_chart(scheduler)
+        # Run the scheduler off the Tk main thread; poll_scheduling() picks up its messages.
+        # The worker only swaps in the new run's timeline after preparing the rerun, so clear
+        # the last one now or the first polls would chart the previous schedule
+        incremental.live_timeline = []
+        self.running_incremental = incremental
+        self.running_cache_key = cache_key
+        self.cancel_event.clear()
+        self.worker = threading.Thread(target=self.run_scheduler, args=(incremental, self.processes),
+                                       daemon=True)
+        self.worker.start()
+        self.master.after(100, self.poll_scheduling)
 
-    def plot_gantt_chart(self, scheduler):
-        for widget in self.gantt_frame.winfo_children():
-            widget.destroy()
+    def run_scheduler(self, incremental, processes):
+        """Worker thread body: schedule and report progress, results or errors through the queue."""
+        def progress(completed, total):
+            if self.cancel_event.is_set():
+                raise ScheduleCancelled()
+            self.worker_queue.put(("progress", completed, total))
 
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        if isinstance(scheduler, RR):
-            # Get execution sequence for Round Robin
-            execution_sequence = self.get_rr_execution_sequence(scheduler)
-            
-            # Create unique process list while preserving order
-            unique_processes = []
-            process_indices = {}  # Maps process name to y-axis position
-            
-            for entry in execution_sequence:
-                process_name = entry['process'].name
-                if process_name not in process_indices:
-                    process_indices[process_name] = len(unique_processes)
-                    unique_processes.append(entry['process'])
+        try:
+            result = incremental.schedule(processes, progress)
+            # Formatting walks every process for the statistics; keep it off the Tk thread too
+            self.worker_queue.put(("done", result, result.format(OUTPUT_ROWS)))
+        except ScheduleCancelled:
+            self.worker_queue.put(("cancelled",))
+        except Exception as e:
+            self.worker_queue.put(("error", e))
 
-            # Create color map
-            cmap = plt.get_cmap('tab10')
-            colors = {process.name: cmap(i % 10) for i, process in enumerate(unique_processes)}
-            
-            # Plot execution blocks
-            for i, entry in enumerate(execution_sequence):
-                process = entry['process']
-                start_time = entry['start_time']
-                end_time = entry['end_time']
-                y_pos = process_indices[process.name]
-                
-                # Plot the execution block
-                ax.barh(y_pos, 
-                       end_time - start_time, 
-                       left=start_time, 
-                       color=colors[process.name], 
-                       edgecolor='black',
-                       alpha=0.7)
-            
-            # Customize the chart
-            ax.set_xlabel('Time')
-            ax.set_ylabel('Processes')
-            ax.set_title('Round Robin Gantt Chart')
-            ax.set_yticks(range(len(unique_processes)))
-            ax.set_yticklabels([f'Process {p.name}' for p in unique_processes])
-            ax.grid(True, axis='x', alpha=0.3)
-            
-            # Add legend
-            handles = [plt.Rectangle((0,0),1,1, color=colors[p.name]) for p in unique_processes]
-            ax.legend(handles, [f'Process {p.name}' for p in unique_processes], 
-                     loc='upper right', bbox_to_anchor=(1.15, 1))
-            
+    def poll_scheduling(self):
+        """Apply worker messages on the Tk thread and chart the timeline computed so far."""
+        finished = None
+        try:
+            while True:
+                message = self.worker_queue.get_nowait()
+                if message[0] == "progress":
+                    self.progress_bar.configure(value=message[1], maximum=max(message[2], 1))
+                else:
+                    finished = message
+        except queue.Empty:
+            pass
+
+        if finished is None:
+            # Draw the slices that came back since the last poll
+            timeline = self.running_incremental.live_timeline
+            if len(timeline) > self.charted_slices:
+                new_slices = timeline[self.charted_slices:]
+                self.charted_slices += len(new_slices)
+                self.gantt_chart.extend(new_slices)
+                self.gantt_canvas.draw_idle()
+            self.master.after(100, self.poll_scheduling)
+            return
+
+        self.worker = None
+        self.set_running(False)
+        self.output_text.configure(state="normal")
+        self.output_text.delete("1.0", tk.END)
+        if finished[0] == "done":
+            result = finished[1]
+            self.progress_bar.configure(value=self.progress_bar.cget("maximum"))
+            self.output_text.insert(tk.END, finished[2])
+            self.gantt_chart.extend(result.timeline[self.charted_slices:])
+            self.gantt_figure.tight_layout()
+            fingerprint, algorithm, params = self.running_cache_key
+            self.result_cache.put(fingerprint, algorithm, params, result)
+            self.shown_result = self.running_cache_key
+        elif finished[0] == "cancelled":
+            self.output_text.insert(tk.END, "Scheduling cancelled.")
         else:
-            # Original implementation for other algorithms
-            processes = self.processes
-            cmap = plt.get_cmap('tab10')
-            colors = cmap(np.linspace(0, 1, len(processes)))
-            
-            for i, process in enumerate(processes):
-                start_time = process.arrival_time
-                end_time = process.arrival_time + process.burst_time
-                ax.barh(i, end_time - start_time, left=start_time, 
-                       color=colors[i], label=f'Process {process.name}')
-            
-            ax.set_xlabel('Time')
-            ax.set_ylabel('Processes')
-            ax.set_title('Gantt Chart')
-            ax.set_yticks(np.arange(len(processes)))
-            ax.set_yticklabels([f'Process {p.name}' for p in processes])
-            ax.legend(loc='upper right')
-            ax.grid(True)
+            self.output_text.insert(tk.END, f"Scheduling failed: {finished[1]}")
+        self.output_text.configure(state="disabled")
+        self.gantt_canvas.draw_idle()
 
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.gantt_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+    def cancel_scheduling(self):
+        """Ask the running scheduler to stop at its next progress check."""
+        self.cancel_event.set()
+        self.cancel_button.configure(state="disabled")
+
+    def set_running(self, running):
+        """Lock process editing and scheduling while a run is in progress."""
+        state = "disabled" if running else "normal"
+        for button in (self.schedule_button, self.add_button, self.edit_button, self.remove_button):
+            button.configure(state=state)
+        self.cancel_button.configure(state="normal" if running else "disabled")
+
+    def plot_gantt_chart(self, timeline, title="Gantt Chart"):
+        """Draw the scheduled timeline as a Gantt chart, reusing one figure and canvas across runs."""
+        if self.gantt_canvas is None:
+            # A plain Figure (not pyplot) is never registered globally, so nothing piles up
+            self.gantt_figure = Figure(figsize=(12, 6))
+            self.gantt_ax = self.gantt_figure.add_subplot()
+            self.gantt_chart = GanttChart(self.gantt_ax)
+            self.gantt_canvas = FigureCanvasTkAgg(self.gantt_figure, master=self.gantt_frame)
+            NavigationToolbar2Tk(self.gantt_canvas, self.gantt_frame).update()
+            self.gantt_canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+
+        self.gantt_chart.draw(timeline, title)
+
+        self.gantt_figure.tight_layout()
+        self.gantt_canvas.draw_idle()
 
-    def get_rr_execution_sequence(self, scheduler):
-        """
-        Simulate Round Robin scheduling to get the execution sequence.
-        Returns a list of dictionaries containing process and its execution time slots.
-        """
-        if not self.processes:
-            return []
-            
-        execution_sequence = []
-        current_time = 0
-        ready_queue = []
-        processes = [Process(p.name, p.arrival_time, p.burst_time, p.priority) 
-                    for p in self.processes]  # Create a deep copy
-        remaining_burst_times = {p.name: p.burst_time for p in processes}
-        
-        while True:
-            # Add newly arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    remaining_burst_times[process.name] > 0 and 
-                    process not in ready_queue):
-                    ready_queue.append(process)
-            
-            if not ready_queue:
-                if all(remaining_burst_times[p.name] == 0 for p in processes):
-                    break
-                current_time += 1
-                continue
-            
-            # Get next process from ready queue
-            current_process = ready_queue.pop(0)
-            
-            # Calculate execution time for this quantum
-            execution_time = min(scheduler.time_quantum, 
-                               remaining_burst_times[current_process.name])
-            
-            # Record execution block
-            execution_sequence.append({
-                'process': current_process,
-                'start_time': current_time,
-                'end_time': current_time + execution_time
-            })
-            
-            # Update time and remaining burst time
-            current_time += execution_time
-            remaining_burst_times[current_process.name] -= execution_time
-            
-            # Re-add process to ready queue if it's not finished
-            if remaining_burst_times[current_process.name] > 0:
-                ready_queue.append(current_process)
-            
-            # Add newly arrived processes that came during this execution
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    remaining_burst_times[process.name] > 0 and 
-                    process not in ready_queue and 
-                    process != current_process):
-                    ready_queue.append(process)
-        
-        return execution_sequence
 def main():
     root = tk.Tk()
     app = SchedulerGUI(root)
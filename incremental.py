@@ -0,0 +1,128 @@
+from bisect import bisect_left
+
+from scheduler import Checkpoint, ScheduleResult
+
+# Busy-period checkpoints recorded per run, spread evenly over its total burst time
+CHECKPOINTS_PER_RUN = 32
+
+
+class IncrementalScheduler:
+    """
+    Re-schedules an edited process list by only recomputing the affected suffix.
+
+    Checkpoints are points of the last timeline that a run can resume from: the start
+    of every idle gap, where all earlier processes have finished and the ready queue
+    is empty, and, for algorithms whose engines record them (FCFS, RR, Priority, SJF
+    and SRTF), dispatch boundaries inside busy periods, about CHECKPOINTS_PER_RUN per
+    run, with a snapshot of the ready queue. MLFQ and CFS keep more state than their
+    ready queue and only checkpoint at idle gaps. Nothing after a checkpoint depends on
+    processes arriving later, so after a change at arrival time `a` the prefix up to
+    the last checkpoint before `a` is reused as-is and only the processes still waiting
+    there or arriving after it are re-simulated. Callers must report every change with
+    process_changed().
+    """
+
+    def __init__(self, scheduler_factory):
+        self.scheduler_factory = scheduler_factory  # Returns a fresh Scheduler per run
+        self.finished = []
+        self.timeline = []
+        # (time, timeline length, engine state) ascending; the state is None at idle gaps and
+        # otherwise a Checkpoint whose ready entries and first starts are keyed by process
+        self.checkpoints = []
+        self.dirty_from = None  # Earliest arrival time touched since the last run
+        self.result = None
+        self.live_timeline = []
+
+    def process_changed(self, *arrival_times):
+        """Record that processes arriving at these times were added, edited or removed."""
+        earliest = min(arrival_times)
+        if self.dirty_from is None or earliest < self.dirty_from:
+            self.dirty_from = earliest
+
+    def reset(self):
+        self.result = None
+        self.dirty_from = None
+
+    def schedule(self, processes, progress=None):
+        if self.result is not None and self.dirty_from is None:
+            if len(self.result) == len(processes):
+                return self.result
+            self.result = None  # Changed without being reported; start over
+
+        position = 0
+        if self.result is not None:
+            # Last checkpoint strictly before the earliest change
+            position = bisect_left(self.checkpoints, (self.dirty_from,))
+
+        resume = None
+        if position == 0:
+            suffix = list(processes)
+            finished = []
+            timeline = []
+            self.checkpoints = []
+        else:
+            resume_at, timeline_length, state = self.checkpoints[position - 1]
+            timeline = self.timeline[:timeline_length]
+            del self.checkpoints[position:]
+            if state is None:
+                suffix = [p for p in processes if p.arrival_time > resume_at]
+                # Every process arriving by the checkpoint finished before it, in the same order
+                finished = self.finished[:len(processes) - len(suffix)]
+                if suffix:
+                    timeline.append(("Idle", resume_at, min(p.arrival_time for p in suffix)))
+            else:
+                finished = self.finished[:state.finished]
+                done = {process for process, _, _ in finished}
+                # The processes waiting at the checkpoint resume with it, in their input order
+                suffix = [p for p in processes if p.arrival_time > resume_at or p not in done]
+                run_index = {process: i for i, process in enumerate(suffix)}
+                ready = state.ready
+                if ready is not None:
+                    ready = [(run_index[process],) + tuple(rest) for process, *rest in ready]
+                resume = Checkpoint(resume_at, timeline_length, state.finished, state.last_run, ready,
+                                    {run_index[process]: t for process, t in state.first_start.items()})
+
+        scheduler = self.scheduler_factory()
+        self.live_timeline = timeline  # Grows while the suffix is being simulated
+        if suffix:
+            suffix_start = len(timeline)
+            suffix_progress = progress
+            reused = len(finished)
+            if progress is not None and finished:
+                # Count the reused prefix too, so progress covers the whole workload
+
+                def suffix_progress(completed, total):
+                    progress(reused + completed, reused + total)
+            scheduler.checkpoint_spacing = max(1, sum(p.burst_time for p in suffix) // CHECKPOINTS_PER_RUN)
+            suffix_completions, suffix_finish_order, _ = scheduler.run(suffix, suffix_progress, timeline=timeline,
+                                                                       resume=resume)
+            checkpoints = [(timeline[position][1], position, None) for position in range(suffix_start, len(timeline))
+                           if timeline[position][0] == "Idle"]
+            for checkpoint in scheduler.checkpoints:
+                ready = checkpoint.ready
+                if ready is not None:
+                    ready = [(suffix[i],) + tuple(rest) for i, *rest in ready]
+                checkpoints.append((checkpoint.time, checkpoint.timeline_length, Checkpoint(
+                    checkpoint.time, checkpoint.timeline_length, reused + checkpoint.finished, checkpoint.last_run,
+                    ready, {suffix[i]: t for i, t in checkpoint.first_start.items()})))
+            checkpoints.sort(key=lambda checkpoint: checkpoint[:2])
+            self.checkpoints.extend(checkpoints)
+            for i in suffix_finish_order:
+                finished.append((suffix[i], suffix_completions[i], scheduler.start_times[i]))
+
+        index = {process: i for i, process in enumerate(processes)}
+        completion_times = [0] * len(processes)
+        start_times = [0] * len(processes)
+        finish_order = []
+        for process, completion_time, start_time in finished:
+            i = index[process]
+            completion_times[i] = completion_time
+            start_times[i] = start_time
+            finish_order.append(i)
+
+        self.finished = finished  # (process, completion_time, start_time) in finish order
+        self.timeline = timeline
+        self.dirty_from = None
+        self.result = ScheduleResult(processes, completion_times, finish_order, timeline,
+                                     show_priority=scheduler.show_priority, start_times=start_times)
+        return self.result
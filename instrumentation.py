@@ -0,0 +1,96 @@
+import json
+from collections import Counter
+from time import perf_counter
+
+
+class Instrumentation:
+    """
+    Opt-in profiling for the scheduler engines: set `scheduler.probe = Instrumentation()`.
+
+    counters  dispatches, enqueues, dequeues, idle_jumps, scans and slices
+    timers    wall-clock seconds (and call counts) for run, select, stats and format
+    on_slice  called as on_slice(name, start, end, core) for every timeline entry,
+              delivered in order as processes complete
+
+    With probe left as None the engines only pay for an `is not None` test at
+    each instrumented site. Slices are kept (record_slices) so the run can be
+    exported with write_chrome_trace() and opened in chrome://tracing or Perfetto.
+    """
+
+    def __init__(self, on_slice=None, record_slices=True):
+        self.on_slice = on_slice
+        self.record_slices = record_slices
+        self.counters = Counter()
+        self.timers = {}  # Name -> [total seconds, calls]
+        self.slices = []  # (name, start, end, core) in simulation time
+        self.spans = []  # (name, wall-clock start, duration) for the coarse phases
+        self._epoch = perf_counter()
+
+    def add_time(self, name, started, span=True):
+        """Charge perf_counter() - started to timer `name`; coarse phases also become trace spans."""
+        elapsed = perf_counter() - started
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = [0.0, 0]
+        timer[0] += elapsed
+        timer[1] += 1
+        if span:
+            self.spans.append((name, started - self._epoch, elapsed))
+
+    def timed(self, name, function, *args):
+        """Call function(*args), charging it to timer `name` and counting a dequeue."""
+        started = perf_counter()
+        value = function(*args)
+        self.add_time(name, started, span=False)
+        self.counters["dequeues"] += 1
+        return value
+
+    def drain(self, timeline, start, slice_cores=None):
+        """Deliver timeline[start:] to the slice hook and recorder; return the new position."""
+        end = len(timeline)
+        self.counters["slices"] += end - start
+        if self.on_slice is None and not self.record_slices:
+            return end
+        for position in range(start, end):
+            name, slice_start, slice_end = timeline[position]
+            core = slice_cores[position] if slice_cores is not None else None
+            if self.on_slice is not None:
+                self.on_slice(name, slice_start, slice_end, core)
+            if self.record_slices:
+                self.slices.append((name, slice_start, slice_end, core))
+        return end
+
+    def to_dict(self):
+        return {
+            "counters": dict(self.counters),
+            "timers": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.timers.items()},
+        }
+
+    def write_json(self, path):
+        """Write the counters and timers as a JSON summary."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def chrome_trace(self):
+        """
+        Trace Event Format dict: process 1 is the simulated CPU(s), one thread per core,
+        with simulation time units shown as microseconds; process 2 is the scheduler
+        itself, with wall-clock spans for each timed phase.
+        """
+        events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "Simulated CPU"}},
+            {"name": "process_name", "ph": "M", "pid": 2, "args": {"name": "Scheduler"}},
+        ]
+        for name, start, end, core in self.slices:
+            category = name if name in ("Idle", "Switch", "Warmup") else "process"
+            events.append({"name": name, "cat": category, "ph": "X", "pid": 1, "tid": core or 0,
+                           "ts": start, "dur": end - start})
+        for name, start, duration in self.spans:
+            events.append({"name": name, "cat": "scheduler", "ph": "X", "pid": 2, "tid": 0,
+                           "ts": start * 1e6, "dur": duration * 1e6})
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.to_dict()}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
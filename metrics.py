@@ -0,0 +1,93 @@
+import math
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram for non-negative time values.
+
+    Values below 2**precision get a bucket each; above that, every power-of-two range
+    is split into 2**(precision - 1) equal buckets, so a reported percentile is within
+    a relative error of 2**(1 - precision) of the true value (under 1% by default).
+    Only occupied buckets are stored, so memory grows with the logarithm of the value
+    range rather than with the number of samples. Histograms of the same precision
+    merge by adding bucket counts, which makes them suitable for streaming runs and
+    for combining the results of parallel shards.
+    """
+    __slots__ = ("precision", "counts", "count", "total", "min", "max")
+
+    def __init__(self, precision=8):
+        if precision < 1:
+            raise ValueError("Histogram precision must be at least 1 bit")
+        self.precision = precision
+        self.counts = {}  # Bucket index -> number of values
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        value = int(value)
+        shift = value.bit_length() - self.precision
+        if shift <= 0:
+            return value
+        return (shift << (self.precision - 1)) + (value >> shift)
+
+    def _bucket_value(self, bucket):
+        """Midpoint of the values that fall into `bucket`."""
+        half = 1 << (self.precision - 1)
+        if bucket < 2 * half:
+            return bucket
+        shift = bucket // half - 1
+        low = (bucket - (shift << (self.precision - 1))) << shift
+        return low + ((1 << shift) - 1) / 2
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError(f"Histogram values must be non-negative, got {value}")
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Add the values recorded by another histogram of the same precision."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms of different precision")
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def percentile(self, percent):
+        """Smallest recorded value (within the histogram's precision) at or above `percent` of all values."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                # Buckets are wider than the data near the extremes; never report past them
+                return min(max(self._bucket_value(bucket), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self):
+        """{"p50": ..., "p95": ..., "p99": ..., "max": ...} for reports."""
+        summary = {f"p{percent}": self.percentile(percent) for percent in PERCENTILES}
+        summary["max"] = self.max if self.max is not None else 0
+        return summary
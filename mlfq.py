@@ -0,0 +1,115 @@
+from collections import deque
+
+from scheduler import Scheduler
+
+
+class MLFQ(Scheduler):
+    def __init__(self, quanta=(2, 4, 8), boost_interval=None, switch_cost=0):
+        super().__init__(switch_cost)
+        if not quanta or any(quantum <= 0 for quantum in quanta):
+            raise ValueError("MLFQ quanta must be positive")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("Boost interval must be positive")
+        self.quanta = tuple(quanta)  # Time quantum per level, highest priority first
+        self.boost_interval = boost_interval  # Move every process back to the top level this often
+
+    def _engine(self, jobs, timeline):
+        """
+        Multilevel feedback queue with one deque per level.
+        New processes enter the top level; a process that uses up its level's quantum
+        drops one level (the last level is plain RR). Arrivals preempt a process
+        running below the top level, which then resumes first at its own level with
+        the rest of its quantum. With boost_interval, all processes periodically
+        return to the top level so long jobs cannot starve.
+        """
+        quanta = self.quanta
+        bottom = len(quanta) - 1
+        boost_interval = self.boost_interval
+
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        if pending is None:
+            return
+        levels = [deque() for _ in quanta]  # [job, remaining_time, level, quantum_used] entries
+        current_time = pending[2]
+        # Boosts fall on multiples of boost_interval, so they do not depend on where a run starts
+        next_boost = (current_time // boost_interval + 1) * boost_interval if boost_interval else None
+        running = None
+        slice_start = None
+
+        def enqueue(job):
+            levels[0].append([job, job[3], 0, 0])
+
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+
+            if next_boost is not None and current_time >= next_boost:
+                for level in levels[1:]:
+                    if probe is not None:
+                        probe.counters["scans"] += len(level)
+                    for entry in level:
+                        entry[2] = entry[3] = 0
+                    levels[0].extend(level)
+                    level.clear()
+                if running is not None:
+                    running[2] = running[3] = 0
+                while next_boost <= current_time:
+                    next_boost += boost_interval
+
+            if running is not None and running[2] > 0 and levels[0]:
+                # A new arrival outranks the running process
+                if timeline is not None and slice_start < current_time:
+                    timeline.append((running[0][1], slice_start, current_time))
+                levels[running[2]].appendleft(running)
+                if probe is not None:
+                    probe.counters["enqueues"] += 1
+                running = None
+
+            if running is None:
+                level = next((level for level in levels if level), None)
+                if level is None:
+                    if pending is None:
+                        break
+                    current_time = self._idle_until(current_time, pending[2], timeline)
+                    continue
+                if probe is None:
+                    running = level.popleft()
+                else:
+                    # Levels looked at to find the first non-empty one
+                    probe.counters["scans"] += next(depth for depth, candidate in enumerate(levels)
+                                                    if candidate is level) + 1
+                    running = probe.timed("select", level.popleft)
+                slice_start = current_time = self._context_switch(running[0], current_time, timeline)
+
+            job, remaining, level, used = running
+            end_time = current_time + min(remaining, quanta[level] - used)
+            if level > 0 and pending is not None and pending[2] < end_time:
+                end_time = pending[2]
+            if next_boost is not None and next_boost < end_time:
+                end_time = next_boost
+            # Events that fell inside the context switch are handled as soon as it ends
+            end_time = max(end_time, current_time)
+            ran = end_time - current_time
+            running[1] = remaining = remaining - ran
+            running[3] = used = used + ran
+            current_time = end_time
+            self.current_time = current_time
+
+            if remaining == 0:
+                if timeline is not None:
+                    timeline.append((job[1], slice_start, current_time))
+                running = None
+                yield job, current_time
+            elif used == quanta[level]:
+                # Used its whole quantum: demote (the bottom level just round-robins)
+                if timeline is not None:
+                    timeline.append((job[1], slice_start, current_time))
+                # Processes that arrived during the slice queue ahead of it
+                pending = self._admit(jobs, pending, current_time, enqueue)
+                running[2] = min(level + 1, bottom)
+                running[3] = 0
+                levels[running[2]].append(running)
+                if probe is not None:
+                    probe.counters["enqueues"] += 1
+                running = None
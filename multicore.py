@@ -0,0 +1,275 @@
+import heapq
+from collections import deque
+
+from scheduler import NON_PROCESS_SLICES, ScheduleResult, Scheduler
+
+INFINITY = float("inf")
+
+
+class MultiCoreResult(ScheduleResult):
+    """ScheduleResult with per-core statistics from a MultiCore run."""
+
+    def __init__(self, processes, completion_times, finish_order, timeline, scheduler):
+        super().__init__(processes, completion_times, finish_order, timeline, show_priority=scheduler.show_priority,
+                         start_times=scheduler.start_times)
+        self.cores = self.cpus = scheduler.cores
+        self.busy_time = list(scheduler.busy_time)
+        self.migrations = scheduler.migrations
+        self.context_switches = scheduler.context_switches
+        self.switch_time = scheduler.switch_time
+        self.migration_time = scheduler.migration_time
+        self.slice_cores = scheduler.slice_cores  # Core that ran each timeline entry (None for Idle)
+        self.makespan = max(completion_times, default=0)
+        self.start_time = min((start for name, start, _ in timeline if name not in NON_PROCESS_SLICES), default=0)
+
+    @property
+    def utilization(self):
+        """Fraction of the schedule span each core spent running processes."""
+        span = self.makespan - self.start_time
+        return [busy / span if span else 0.0 for busy in self.busy_time]
+
+    def core_timelines(self):
+        """Split the timeline into one (name, start, end) list per core."""
+        timelines = [[] for _ in range(self.cores)]
+        for entry, core in zip(self.timeline, self.slice_cores):
+            if core is not None:
+                timelines[core].append(entry)
+        return timelines
+
+
+class MultiCore(Scheduler):
+    """
+    Simulates `cores` CPUs sharing one workload.
+
+    discipline picks the ready-queue order: "FCFS", "RR" (with quantum_time) or
+    non-preemptive "Priority". With queue_mode="global" every core pulls from one
+    shared ready queue; with queue_mode="per-core" arrivals go to the core with the
+    shortest queue and a core that runs dry steals the next job from the longest
+    one; cores freed with work queued on them take it first, so they never lose it
+    to a steal. In global mode a job resumes on the core it last ran on whenever that
+    core is idle. Slice ends are kept in an event heap with at most one entry per core, and
+    idle cores and queue lengths in (lazy) heaps, so each event costs O(log cores).
+    A migration is a job resuming on a different core than the one it last ran on;
+    it costs migration_cost time units of cache warmup ("Warmup" entries) on top of
+    the per-core switch_cost.
+    """
+
+    def __init__(self, cores=2, discipline="FCFS", quantum_time=None, queue_mode="global",
+                 switch_cost=0, migration_cost=0):
+        super().__init__(switch_cost)
+        if cores < 1:
+            raise ValueError("Core count must be at least 1")
+        if discipline not in ("FCFS", "RR", "Priority"):
+            raise ValueError(f"Unknown multi-core discipline: {discipline}")
+        if discipline == "RR" and (quantum_time is None or quantum_time <= 0):
+            raise ValueError("Quantum time must be positive")
+        if queue_mode not in ("global", "per-core"):
+            raise ValueError(f"Unknown queue mode: {queue_mode}")
+        if migration_cost < 0:
+            raise ValueError("Migration cost cannot be negative")
+        self.cores = cores
+        self.discipline = discipline
+        self.time_quantum = quantum_time if discipline == "RR" else None
+        self.queue_mode = queue_mode
+        self.show_priority = discipline == "Priority"
+        self.busy_time = [0] * cores
+        self.migrations = 0
+        self.migration_cost = migration_cost
+        self.migration_time = 0
+        self.slice_cores = []
+
+    def schedule(self, processes, progress=None):
+        if not processes:
+            return ScheduleResult([], [], [], [])
+        completion_times, finish_order, timeline = self.run(processes, progress)
+        result = MultiCoreResult(processes, completion_times, finish_order, timeline, self)
+        result.probe = self.probe
+        self.total_waiting_time = result.total_waiting_time
+        self.total_turnaround_time = result.total_turnaround_time
+        return result
+
+    def _engine(self, jobs, timeline):
+        cores = self.cores
+        quantum = self.time_quantum
+        by_priority = self.discipline == "Priority"
+        per_core = self.queue_mode == "per-core"
+        self.busy_time = busy_time = [0] * cores
+        self.migrations = 0
+        self.migration_time = 0
+        self.slice_cores = slice_cores = []
+        switch_cost = self.switch_cost
+        migration_cost = self.migration_cost
+
+        # Ready entries are [job, remaining_time, last_core]
+        probe = self.probe
+
+        def new_queue():
+            return [] if by_priority else deque()
+
+        def push(ready, entry):
+            if by_priority:
+                job = entry[0]
+                heapq.heappush(ready, (job[4], job[2], job[0], entry))
+            else:
+                ready.append(entry)
+
+        def pop(ready):
+            if probe is not None:
+                if by_priority:
+                    return probe.timed("select", heapq.heappop, ready)[3]
+                return probe.timed("select", ready.popleft)
+            return heapq.heappop(ready)[3] if by_priority else ready.popleft()
+
+        queues = [new_queue() for _ in range(cores if per_core else 1)]
+        shortest = [(0, core) for core in range(len(queues))]  # Lazy heap of (queue length, core)
+        longest = []  # Lazy heap of (-queue length, core)
+        idle_cores = list(range(cores))  # Heap of idle core ids
+        events = []  # Heap of (slice end time, core)
+        running = [None] * cores
+        slice_starts = [0] * cores
+        last_run = [None] * cores  # Process each core ran last
+        last_end = [None] * cores  # When that slice ended; a later start means the core idled in between
+
+        def note_length(core):
+            heapq.heappush(shortest, (len(queues[core]), core))
+            heapq.heappush(longest, (-len(queues[core]), core))
+            if len(shortest) > 8 * cores + 64:
+                # Drop the stale entries the lazy heaps have accumulated
+                if probe is not None:
+                    probe.counters["scans"] += len(queues)
+                shortest[:] = [(len(ready), c) for c, ready in enumerate(queues)]
+                longest[:] = [(-len(ready), c) for c, ready in enumerate(queues)]
+                heapq.heapify(shortest)
+                heapq.heapify(longest)
+
+        def enqueue(core, entry):
+            push(queues[core], entry)
+            if probe is not None:
+                probe.counters["enqueues"] += 1
+            if per_core:
+                note_length(core)
+
+        def take(core):
+            """Next entry for `core`: its own queue first, else steal from the longest queue."""
+            if not per_core:
+                return pop(queues[0]) if queues[0] else None
+            victim = core
+            if not queues[core]:
+                while longest and (not queues[longest[0][1]] or -longest[0][0] != len(queues[longest[0][1]])):
+                    heapq.heappop(longest)
+                    if probe is not None:
+                        probe.counters["scans"] += 1
+                if not longest:
+                    return None
+                victim = longest[0][1]
+            entry = pop(queues[victim])
+            note_length(victim)
+            return entry
+
+        def overhead(name, core, now, duration):
+            if timeline is not None:
+                timeline.append((name, now, now + duration))
+                slice_cores.append(core)
+            return now + duration
+
+        def start(core, entry, now):
+            name = entry[0][1]
+            if last_run[core] is not None and last_run[core] != name and last_end[core] == now:
+                self.context_switches += 1
+                if switch_cost:
+                    self.switch_time += switch_cost
+                    now = overhead("Switch", core, now, switch_cost)
+            if entry[2] is not None and entry[2] != core:
+                self.migrations += 1
+                if migration_cost:
+                    self.migration_time += migration_cost
+                    now = overhead("Warmup", core, now, migration_cost)
+            entry[2] = core
+            self._first_start.setdefault(entry[0][0], now)
+            if probe is not None:
+                probe.counters["dispatches"] += 1
+            if self._heartbeat is not None:
+                self._heartbeat()
+            last_run[core] = name
+            running[core] = entry
+            slice_starts[core] = now
+            run_time = entry[1] if quantum is None else min(quantum, entry[1])
+            heapq.heappush(events, (now + run_time, core))
+
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        current_time = None
+        finished = []
+
+        while True:
+            next_arrival = pending[2] if pending is not None else INFINITY
+            next_end = events[0][0] if events else INFINITY
+            if next_arrival == INFINITY and next_end == INFINITY:
+                break
+            now = min(next_arrival, next_end)
+            if current_time is not None and not events and now > current_time:
+                # Every core is idle and every queue is empty
+                if timeline is not None:
+                    timeline.append(("Idle", current_time, now))
+                    slice_cores.append(None)
+                if probe is not None:
+                    probe.counters["idle_jumps"] += 1
+            current_time = now
+            self.current_time = now
+
+            # Admit arrivals: straight onto an idle core if there is one, else queue them
+            while pending is not None and pending[2] <= now:
+                entry = [pending, pending[3], None]
+                if per_core:
+                    if idle_cores:
+                        start(heapq.heappop(idle_cores), entry, now)
+                    else:
+                        while shortest[0][0] != len(queues[shortest[0][1]]):
+                            heapq.heappop(shortest)
+                            if probe is not None:
+                                probe.counters["scans"] += 1
+                        enqueue(shortest[0][1], entry)
+                else:
+                    enqueue(0, entry)
+                pending = next(jobs, None)
+
+            # Slice ends: finished jobs complete, others go back to a ready queue
+            while events and events[0][0] == now:
+                _, core = heapq.heappop(events)
+                entry = running[core]
+                running[core] = None
+                ran = now - slice_starts[core]
+                last_end[core] = now
+                busy_time[core] += ran
+                entry[1] -= ran
+                if timeline is not None:
+                    timeline.append((entry[0][1], slice_starts[core], now))
+                    slice_cores.append(core)
+                if entry[1] == 0:
+                    finished.append((entry[0], now))
+                else:
+                    enqueue(core if per_core else 0, entry)
+                if per_core and queues[core]:
+                    # Work of its own comes first, so no other core steals it
+                    start(core, take(core), now)
+                else:
+                    heapq.heappush(idle_cores, core)
+
+            # Dispatch the remaining idle cores, lowest id first (stealing in per-core mode)
+            while idle_cores:
+                core = idle_cores[0]
+                entry = take(core)
+                if entry is None:
+                    break
+                last_core = entry[2]
+                if per_core or last_core is None or last_core == core or last_core not in idle_cores:
+                    heapq.heappop(idle_cores)
+                else:
+                    # Global queue: back to the idle core it last ran on, saving a migration
+                    core = last_core
+                    idle_cores.remove(core)
+                    heapq.heapify(idle_cores)
+                start(core, entry, now)
+            for job, completion_time in finished:
+                yield job, completion_time
+            finished.clear()
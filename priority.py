@@ -1,73 +1,112 @@
-class Priority:
-    def __init__(self):
-        self.current_time = 0
-        self.total_waiting_time = 0
-        self.total_turnaround_time = 0
-        self.execution_sequence = []  # Store the execution sequence for Gantt chart
+import heapq
 
-    def schedule(self, processes):
-        if not processes:
-            return "No processes to schedule"
+from scheduler import Scheduler
 
-        remaining_processes = processes.copy()
-        completed_processes = []
-        execution_timeline = []  # Store when each process executes
-        self.current_time = min(p.arrival_time for p in processes)
 
-        while remaining_processes:
-            # Get available processes at current time
-            available_processes = [p for p in remaining_processes 
-                                if p.arrival_time <= self.current_time]
-            
-            if not available_processes:
-                # No process available, move time to next arrival
-                next_arrival = min(p.arrival_time for p in remaining_processes)
-                execution_timeline.append(("Idle", self.current_time, next_arrival))
-                self.current_time = next_arrival
-                continue
+class Priority(Scheduler):
+    show_priority = True
+
+    def __init__(self, preemptive=False, aging_interval=None, switch_cost=0):
+        super().__init__(switch_cost)
+        self.preemptive = preemptive
+        # Waiting this many time units raises a process by one priority level
+        self.aging_interval = aging_interval
+
+    def _engine(self, jobs, timeline):
+        """
+        Heap-driven Priority simulation (lower number = higher priority).
+        Ready processes live in a binary heap keyed on (priority, arrival_time), so
+        every dispatch is O(log n). In preemptive mode the running process is only
+        re-examined at arrival events. With aging, a process's effective priority drops
+        by one whole level per `aging_interval` units spent waiting, to
+        priority - (t - ready_since) // aging_interval; scaling the key to
+        priority * aging_interval + ready_since keeps it static while waiting, so the
+        heap never needs re-keying, and the level at time t is -((t - key) // aging_interval).
+        """
+        aging = self.aging_interval
+        if aging is not None and aging <= 0:
+            raise ValueError("Aging interval must be positive")
+
+        def key(job, ready_since):
+            if aging is None:
+                return job[4]
+            return job[4] * aging + ready_since
+
+        def level(ready_key, now):
+            """Effective priority at `now` of a process waiting with ready_key."""
+            if aging is None:
+                return ready_key
+            return -((now - ready_key) // aging)
+
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        ready_heap = []  # (key, arrival_time, index, [job, remaining_time]) entries
+        if self._resume is not None:
+            current_time, ready = self._resume
+            ready_heap = [(ready_key, job[2], job[0], [job, remaining]) for job, remaining, ready_key in ready]
+            heapq.heapify(ready_heap)
+        elif pending is None:
+            return
+        else:
+            current_time = pending[2]
+        next_checkpoint = self._next_checkpoint
+        running = None
+        running_level = None  # Effective priority the running process was dispatched with
+        slice_start = None
 
-            # Select process with highest priority (lowest priority number)
-            selected_process = min(available_processes, 
-                                key=lambda p: (p.priority, p.arrival_time))
-            
-            # Record execution start time
-            start_time = self.current_time
-            
-            # Execute the process
-            self.current_time += selected_process.burst_time
-            
-            # Calculate times
-            waiting_time = start_time - selected_process.arrival_time
-            turnaround_time = self.current_time - selected_process.arrival_time
-            
-            # Update totals
-            self.total_waiting_time += waiting_time
-            self.total_turnaround_time += turnaround_time
-            
-            # Store execution info
-            execution_timeline.append((selected_process.name, start_time, self.current_time))
-            
-            # Update process info
-            selected_process.waiting_time = waiting_time
-            selected_process.turnaround_time = turnaround_time
-            
-            # Move process to completed
-            remaining_processes.remove(selected_process)
-            completed_processes.append(selected_process)
+        def enqueue(job):
+            heapq.heappush(ready_heap, (key(job, job[2]), job[2], job[0], [job, job[3]]))
 
-        # Store execution sequence for Gantt chart
-        self.execution_sequence = execution_timeline
-        
-        # Generate output string
-        scheduling_output = "Process ID\tArrival Time\tPriority\tBurst Time\tWaiting Time\tTurnaround Time\n"
-        for process in completed_processes:
-            scheduling_output += f"{process.name}\t\t{process.arrival_time}\t\t{process.priority}\t\t{process.burst_time}\t\t{process.waiting_time}\t\t{process.turnaround_time}\n"
-        
-        avg_waiting_time = self.total_waiting_time / len(processes)
-        avg_turnaround_time = self.total_turnaround_time / len(processes)
-        
-        scheduling_output += f"\nAverage Waiting Time: {avg_waiting_time:.2f}\n"
-        scheduling_output += f"Average Turnaround Time: {avg_turnaround_time:.2f}\n"
-        
-        return scheduling_output
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+
+            if running is None:
+                if not ready_heap:
+                    if pending is None:
+                        break
+                    current_time = self._idle_until(current_time, pending[2], timeline)
+                    continue
+                if current_time >= next_checkpoint:
+                    next_checkpoint = self._checkpoint(current_time, timeline, [
+                        (entry[0], remaining, ready_key) for ready_key, _, _, (entry, remaining) in ready_heap])
+                if probe is None:
+                    ready_key, _, _, running = heapq.heappop(ready_heap)
+                else:
+                    ready_key, _, _, running = probe.timed("select", heapq.heappop, ready_heap)
+                running_level = level(ready_key, current_time)
+                slice_start = current_time = self._context_switch(running[0], current_time, timeline)
+
+            # Run until completion or, in preemptive mode, until the next event
+            job, remaining = running
+            end_time = current_time + remaining
+            if self.preemptive:
+                if pending is not None:
+                    end_time = min(end_time, pending[2])
+                if aging is not None and ready_heap:
+                    # First moment the best waiting process has aged a whole level past the running one
+                    end_time = min(end_time, ready_heap[0][0] + (1 - running_level) * aging)
+                # Events that fell inside the context switch are handled as soon as it ends
+                end_time = max(end_time, current_time)
+
+            running[1] = remaining = remaining - (end_time - current_time)
+            current_time = end_time
+            self.current_time = current_time
+
+            if remaining == 0:
+                if timeline is not None:
+                    timeline.append((job[1], slice_start, current_time))
+                running = None
+                yield job, current_time
+                continue
 
+            # Preemptive mode: admit arrivals and give up the CPU to a strictly better process
+            pending = self._admit(jobs, pending, current_time, enqueue)
+            if ready_heap:
+                if level(ready_heap[0][0], current_time) < running_level:
+                    if timeline is not None and slice_start < current_time:
+                        timeline.append((job[1], slice_start, current_time))
+                    heapq.heappush(ready_heap, (key(job, current_time), job[2], job[0], running))
+                    if probe is not None:
+                        probe.counters["enqueues"] += 1
+                    running = None
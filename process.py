@@ -1,4 +1,10 @@
+from array import array
+
+
 class Process:
+    __slots__ = ("name", "arrival_time", "burst_time", "priority",
+                 "waiting_time", "turnaround_time", "remaining_time")
+
     def __init__(self, name, arrival_time, burst_time, priority):
         self.name = name
         self.arrival_time = arrival_time
@@ -6,4 +12,114 @@ class Process:
         self.priority = priority
         self.waiting_time = 0
         self.turnaround_time = 0
-        self.remaining_time = burst_time 
+        self.remaining_time = burst_time
+
+
+class ProcessView:
+    """Lightweight Process-like view of one row of a ProcessTable."""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self):
+        return self.table.names[self.index]
+
+    @name.setter
+    def name(self, value):
+        self.table.names[self.index] = value
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival_time[self.index]
+
+    @arrival_time.setter
+    def arrival_time(self, value):
+        self.table.arrival_time[self.index] = value
+
+    @property
+    def burst_time(self):
+        return self.table.burst_time[self.index]
+
+    @burst_time.setter
+    def burst_time(self, value):
+        self.table.burst_time[self.index] = value
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @priority.setter
+    def priority(self, value):
+        self.table.priority[self.index] = value
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining_time[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining_time[self.index] = value
+
+
+class ProcessTable:
+    """
+    Columnar process storage: one contiguous int64 array per attribute instead of
+    one object per process. Indexing yields ProcessView rows, so code written
+    against Process keeps working, while schedulers read the columns directly.
+    """
+    typecode = "q"
+    row_type = ProcessView  # Returned by indexing and iteration
+
+    def __init__(self, names=(), arrival_time=(), burst_time=(), priority=()):
+        self.names = list(names)
+        self.arrival_time = array(self.typecode, arrival_time)
+        self.burst_time = array(self.typecode, burst_time)
+        self.priority = array(self.typecode, priority)
+        self.remaining_time = array(self.typecode, self.burst_time)
+        if not len(self.names) == len(self.arrival_time) == len(self.burst_time) == len(self.priority):
+            raise ValueError("Process table columns must have the same length")
+
+    @classmethod
+    def from_processes(cls, processes):
+        return cls([p.name for p in processes], [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes], [p.priority for p in processes])
+
+    def append(self, name, arrival_time, burst_time, priority):
+        self.names.append(name)
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(priority)
+        self.remaining_time.append(burst_time)
+
+    def columns(self):
+        return self.names, self.arrival_time, self.burst_time, self.priority
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("process index out of range")
+        return self.row_type(self, index)
+
+    def __iter__(self):
+        row_type = self.row_type
+        for index in range(len(self)):
+            yield row_type(self, index)
+
+
+def process_columns(processes):
+    """Return (names, arrival_times, burst_times, priorities) for a list of processes or a ProcessTable."""
+    if isinstance(processes, ProcessTable):
+        names, arrivals, bursts, priorities = processes.columns()
+        if hasattr(arrivals, "dtype"):
+            # NumPy-backed tables: element access on ndarrays is slow in Python loops
+            return names, arrivals.tolist(), bursts.tolist(), priorities.tolist()
+        return names, arrivals, bursts, priorities
+    return ([p.name for p in processes], [p.arrival_time for p in processes],
+            [p.burst_time for p in processes], [p.priority for p in processes])
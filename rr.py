@@ -1,55 +1,84 @@
-class RR:
-    def __init__(self, quantum_time):
-        self.current_time = 0
-        self.time_quantum = quantum_time  
-        self.total_waiting_time = 0
-        self.total_turnaround_time = 0
-
-    def schedule(self, processes):
-        if not processes:
-            return "No processes to schedule"
-        
-        remaining_burst_time = [process.burst_time for process in processes]
-        waiting_times = [0] * len(processes)
-        gantt_chart = []  # To store the execution order for the Gantt chart
-        finished_processes = 0  # Count of finished processes
-
-        scheduling_output = f"{'Process ID':^12}{'Arrival Time':^15}{'Burst Time':^12}{'Waiting Time':^15}{'Turnaround Time':^17}\n"
-        scheduling_output += "-" * 71 + "\n"
-        while finished_processes < len(processes):
-            process_found = False
-            for i, process in enumerate(processes):
-                # Check if the process has arrived and still has burst time left
-                if remaining_burst_time[i] > 0 and process.arrival_time <= self.current_time:
-                    process_found = True  # At least one process is ready to execute
-                    if remaining_burst_time[i] > self.time_quantum:
-                        gantt_chart.append(process.name)  # Record execution for Gantt chart
-                        self.current_time += self.time_quantum
-                        remaining_burst_time[i] -= self.time_quantum
-                    else:
-                        gantt_chart.append(process.name)  # Record execution for Gantt chart
-                        self.current_time += remaining_burst_time[i]
-                        process_turnaround_time = self.current_time - process.arrival_time
-                        self.total_turnaround_time += process_turnaround_time
-                        
-                        waiting_times[i] = process_turnaround_time - process.burst_time
-                        self.total_waiting_time += waiting_times[i]
-                        
-                        scheduling_output += f"{process.name}\t\t{process.arrival_time}\t\t{process.burst_time}\t\t{waiting_times[i]}\t\t{process_turnaround_time}\n"
-                        remaining_burst_time[i] = 0  # Process finished
-                        finished_processes += 1  # Increment finished process count
-
-            # If no process was found, increment current time to the next arriving process
-            if not process_found:
-                next_process_arrival = min(
-                    process.arrival_time for process in processes if process.arrival_time > self.current_time
-                )
-                self.current_time = next_process_arrival  # Jump to next arrival time
-
-        avg_waiting_time = self.total_waiting_time / len(processes)
-        avg_turnaround_time = self.total_turnaround_time / len(processes)
-
-        scheduling_output += f"\nAverage Waiting Time: {avg_waiting_time:.2f}\n"
-        scheduling_output += f"Average Turnaround Time: {avg_turnaround_time:.2f}\n"
-
-        return scheduling_output, gantt_chart  # Return gantt_chart as well
\ No newline at end of file
+from collections import deque
+
+from scheduler import Scheduler
+
+
+class RR(Scheduler):
+    def __init__(self, quantum_time, switch_cost=0):
+        super().__init__(switch_cost)
+        self.time_quantum = quantum_time
+
+    def _engine(self, jobs, timeline):
+        """
+        Event-driven Round Robin simulation.
+        Jobs are pulled from the arrival-ordered input only when the clock reaches
+        them and go into a deque ready queue, so each process is enqueued exactly once
+        per slice and no membership scans are needed. When a single process has the
+        CPU to itself it runs straight through to the first quantum boundary at or
+        after the next arrival. Runs in O(number of slices).
+        """
+        quantum = self.time_quantum
+        if quantum <= 0:
+            raise ValueError("Quantum time must be positive")
+
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        ready_queue = deque()  # [job, remaining_time] entries
+        if self._resume is not None:
+            current_time, ready = self._resume
+            ready_queue.extend([job, remaining] for job, remaining in ready)
+        elif pending is None:
+            return
+        else:
+            current_time = pending[2]
+        next_checkpoint = self._next_checkpoint
+
+        def enqueue(job):
+            ready_queue.append([job, job[3]])
+
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+            if not ready_queue:
+                if pending is None:
+                    break
+                current_time = self._idle_until(current_time, pending[2], timeline)
+                continue
+
+            if current_time >= next_checkpoint:
+                next_checkpoint = self._checkpoint(current_time, timeline,
+                                                   [(job[0], remaining) for job, remaining in ready_queue])
+            if probe is None:
+                entry = ready_queue.popleft()
+            else:
+                entry = probe.timed("select", ready_queue.popleft)
+            job, remaining = entry
+            current_time = self._context_switch(job, current_time, timeline)
+            run_time = min(quantum, remaining)
+            if not ready_queue and remaining > quantum:
+                # Nobody to preempt for: keep running until the first quantum boundary
+                # at or after the next arrival (or until the burst is done)
+                if pending is not None:
+                    gap = pending[2] - current_time
+                    slices = max(1, -(-gap // quantum))
+                    run_time = min(remaining, slices * quantum)
+                else:
+                    run_time = remaining
+
+            start_time = current_time
+            current_time += run_time
+            remaining -= run_time
+            self.current_time = current_time
+            if timeline is not None:
+                timeline.append((job[1], start_time, current_time))
+
+            # Processes that arrived during this slice queue ahead of the preempted one
+            pending = self._admit(jobs, pending, current_time, enqueue)
+
+            if remaining > 0:
+                entry[1] = remaining
+                ready_queue.append(entry)
+                if probe is not None:
+                    probe.counters["enqueues"] += 1
+            else:
+                yield job, current_time
@@ -0,0 +1,547 @@
+from time import perf_counter
+
+from metrics import LatencyHistogram
+from process import process_columns
+
+# Wall-clock seconds between progress reports while a run has no completions to report
+PROGRESS_SECONDS = 0.1
+INFINITY = float("inf")
+
+# Timeline entries that are not a process running: CPU idle, context switch, cache warmup after a migration
+NON_PROCESS_SLICES = frozenset(("Idle", "Switch", "Warmup"))
+
+
+def switch_totals(timeline):
+    """
+    Return (context_switches, switch_time) for a single-CPU timeline.
+    With a switch cost every switch is a "Switch" entry; without one, a switch is a
+    slice of one process directly followed by a slice of another (an idle gap in
+    between does not count).
+    """
+    switches = 0
+    switch_time = 0
+    last = None
+    for name, start_time, end_time in timeline:
+        if name == "Switch":
+            switches += 1
+            switch_time += end_time - start_time
+            last = None
+        elif name == "Idle":
+            last = None
+        elif name not in NON_PROCESS_SLICES:
+            if last is not None and last != name:
+                switches += 1
+            last = name
+    return switches, switch_time
+
+
+class ScheduleResult:
+    """
+    Outcome of one scheduling run.
+    Per-process lists (completion_times, start_times, waiting_times, turnaround_times,
+    response_times) are aligned with the input process order, finish_order lists
+    process indices in the order they completed, and timeline holds (name, start, end)
+    slices including "Idle" gaps. stats aggregates them into percentiles, throughput
+    and utilization.
+    context_switches and switch_time count the switches between processes and the
+    time spent in them. Text rendering is deferred to format() so batch users never
+    pay for it.
+    """
+    probe = None  # Instrumentation of the scheduler that produced this result, if any
+
+    def __init__(self, processes, completion_times, finish_order, timeline, show_priority=False, start_times=None):
+        self.processes = processes
+        self.completion_times = completion_times
+        self.start_times = start_times if start_times is not None else list(completion_times)
+        self.finish_order = finish_order
+        self.timeline = timeline
+        self.show_priority = show_priority
+        _, arrivals, bursts, _ = process_columns(processes)
+        self.turnaround_times = [completion - arrival for completion, arrival in zip(completion_times, arrivals)]
+        self.waiting_times = [turnaround - burst for turnaround, burst in zip(self.turnaround_times, bursts)]
+        self.response_times = [start - arrival for start, arrival in zip(self.start_times, arrivals)]
+        self.context_switches, self.switch_time = switch_totals(timeline)
+        self.migration_time = 0
+        self.cpus = 1
+        self._stats = None
+
+    def __len__(self):
+        return len(self.completion_times)
+
+    @property
+    def total_waiting_time(self):
+        return sum(self.waiting_times)
+
+    @property
+    def total_turnaround_time(self):
+        return sum(self.turnaround_times)
+
+    @property
+    def avg_waiting_time(self):
+        return self.total_waiting_time / len(self) if len(self) else 0.0
+
+    @property
+    def avg_turnaround_time(self):
+        return self.total_turnaround_time / len(self) if len(self) else 0.0
+
+    @property
+    def stats(self):
+        """RunningStats over every process, built on first use."""
+        if self._stats is None:
+            started = perf_counter()
+            stats = RunningStats(self.cpus)
+            _, arrivals, bursts, _ = process_columns(self.processes)
+            for i in range(len(self)):
+                stats.record(arrivals[i], bursts[i], self.completion_times[i], self.waiting_times[i],
+                             self.turnaround_times[i], self.response_times[i])
+            stats.overhead_time = self.switch_time + self.migration_time
+            self._stats = stats
+            if self.probe is not None:
+                self.probe.add_time("stats", started)
+        return self._stats
+
+    def format(self, max_rows=None):
+        """Text table of the result; with max_rows, only that many process rows are listed."""
+        if self.probe is None:
+            return format_result(self, max_rows)
+        self.stats  # Charged to its own timer, not to formatting
+        started = perf_counter()
+        text = format_result(self, max_rows)
+        self.probe.add_time("format", started)
+        return text
+
+    def __str__(self):
+        return self.format()
+
+
+def format_result(result, max_rows=None):
+    """
+    Render a ScheduleResult as the text table shown in the GUI. With max_rows, the
+    table stops after that many processes (in finish order) and says how many it left out.
+    """
+    if not len(result):
+        return "No processes to schedule"
+
+    priority_header = f"{'Priority':^10}" if result.show_priority else ""
+    header = f"{'Process ID':^12}{'Arrival Time':^15}{priority_header}{'Burst Time':^12}{'Waiting Time':^15}{'Turnaround Time':^17}\n"
+    rows = [header, "-" * (len(header) - 1) + "\n"]
+    finish_order = result.finish_order
+    if max_rows is not None and len(finish_order) > max_rows:
+        finish_order = finish_order[:max_rows]
+    for i in finish_order:
+        process = result.processes[i]
+        priority_cell = f"{process.priority:^10}" if result.show_priority else ""
+        rows.append(f"{process.name:^12}{process.arrival_time:^15}{priority_cell}{process.burst_time:^12}"
+                    f"{result.waiting_times[i]:^15}{result.turnaround_times[i]:^17}\n")
+    if len(finish_order) < len(result.finish_order):
+        rows.append(f"... {len(result.finish_order) - len(finish_order)} more processes\n")
+
+    rows.append(f"\nAverage Waiting Time: {result.avg_waiting_time:.2f}\n")
+    rows.append(f"Average Turnaround Time: {result.avg_turnaround_time:.2f}\n")
+    rows.append(f"Context Switches: {result.context_switches}\n")
+    if result.switch_time or result.migration_time:
+        rows.append(f"Time Lost to Switching: {result.switch_time + result.migration_time}\n")
+    rows.append(format_stats(result.stats))
+    return "".join(rows)
+
+
+def format_stats(stats):
+    """Percentile, throughput and utilization lines for a RunningStats."""
+    rows = [f"\n{'':<17}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}\n"]
+    for label, histogram in (("Waiting Time", stats.waiting), ("Turnaround Time", stats.turnaround),
+                             ("Response Time", stats.response)):
+        summary = histogram.summary()
+        rows.append(f"{label:<17}" + "".join(f"{summary[key]:>10g}" for key in ("p50", "p95", "p99", "max")) + "\n")
+    rows.append(f"\nThroughput: {stats.throughput:.4f} processes per time unit\n")
+    rows.append(f"CPU Utilization: {stats.utilization:.1%}\n")
+    rows.append(f"Idle Time: {stats.idle_time}\n")
+    return "".join(rows)
+
+
+class ScheduleCancelled(Exception):
+    """Raised from a progress callback to stop a scheduling run cooperatively."""
+
+
+class CompletedProcess:
+    """Record emitted by Scheduler.stream() when a process finishes."""
+    __slots__ = ("name", "arrival_time", "burst_time", "priority", "start_time",
+                 "completion_time", "waiting_time", "turnaround_time", "response_time")
+
+    def __init__(self, name, arrival_time, burst_time, priority, completion_time, start_time):
+        self.name = name
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.start_time = start_time  # First time the process got the CPU
+        self.completion_time = completion_time
+        self.turnaround_time = completion_time - arrival_time
+        self.waiting_time = self.turnaround_time - burst_time
+        self.response_time = start_time - arrival_time
+
+
+class Checkpoint:
+    """
+    Engine state at a dispatch boundary of a run, for resuming it with Scheduler.run(resume=...).
+    Nothing is running at `time`, and every job that arrived by then has either finished
+    (the first `finished` of the run's finish order) or waits in `ready`, as
+    (process index, ...) tuples in the engine's own format; with ready None the engine
+    orders the waiting jobs by arrival itself. first_start holds the first start time of
+    waiting jobs that already ran.
+    """
+    __slots__ = ("time", "timeline_length", "finished", "last_run", "ready", "first_start")
+
+    def __init__(self, time, timeline_length, finished, last_run, ready, first_start):
+        self.time = time
+        self.timeline_length = timeline_length
+        self.finished = finished
+        self.last_run = last_run  # Name of the process that ran last, for charging the next switch
+        self.ready = ready
+        self.first_start = first_start
+
+
+class RunningStats:
+    """
+    Constant-memory aggregates over the processes completed so far.
+    Waiting, turnaround and response times go into LatencyHistograms for percentiles.
+    Stats from parallel shards combine with merge(): the shards' CPUs are treated as
+    running side by side, so their CPU counts add up and utilization and idle time
+    are measured against the combined capacity.
+    """
+
+    def __init__(self, cpus=1):
+        self.cpus = cpus
+        self.count = 0
+        self.busy_time = 0  # CPU time spent running processes
+        self.overhead_time = 0  # CPU time lost to context switches and cache warmup; set by the caller
+        self.first_arrival = None
+        self.makespan = 0
+        self.waiting = LatencyHistogram()
+        self.turnaround = LatencyHistogram()
+        self.response = LatencyHistogram()
+
+    def add(self, record):
+        self.record(record.arrival_time, record.burst_time, record.completion_time, record.waiting_time,
+                    record.turnaround_time, record.response_time)
+
+    def record(self, arrival_time, burst_time, completion_time, waiting_time, turnaround_time, response_time):
+        self.count += 1
+        self.busy_time += burst_time
+        if self.first_arrival is None or arrival_time < self.first_arrival:
+            self.first_arrival = arrival_time
+        if completion_time > self.makespan:
+            self.makespan = completion_time
+        self.waiting.add(waiting_time)
+        self.turnaround.add(turnaround_time)
+        self.response.add(response_time)
+
+    def merge(self, other):
+        """Fold in the stats of another shard."""
+        self.cpus += other.cpus
+        self.count += other.count
+        self.busy_time += other.busy_time
+        self.overhead_time += other.overhead_time
+        if other.first_arrival is not None and (self.first_arrival is None or other.first_arrival < self.first_arrival):
+            self.first_arrival = other.first_arrival
+        self.makespan = max(self.makespan, other.makespan)
+        self.waiting.merge(other.waiting)
+        self.turnaround.merge(other.turnaround)
+        self.response.merge(other.response)
+        return self
+
+    @property
+    def total_waiting_time(self):
+        return self.waiting.total
+
+    @property
+    def total_turnaround_time(self):
+        return self.turnaround.total
+
+    @property
+    def max_waiting_time(self):
+        return self.waiting.max or 0
+
+    @property
+    def max_turnaround_time(self):
+        return self.turnaround.max or 0
+
+    @property
+    def span(self):
+        """Time from the first arrival to the last completion."""
+        return self.makespan - self.first_arrival if self.count else 0
+
+    @property
+    def throughput(self):
+        return self.count / self.span if self.span else 0.0
+
+    @property
+    def utilization(self):
+        capacity = self.span * self.cpus
+        return self.busy_time / capacity if capacity else 0.0
+
+    @property
+    def idle_time(self):
+        return self.span * self.cpus - self.busy_time - self.overhead_time
+
+    def to_dict(self):
+        """Percentiles, throughput and utilization as a JSON-ready dict."""
+        return {
+            "waiting_time": self.waiting.summary(),
+            "turnaround_time": self.turnaround.summary(),
+            "response_time": self.response.summary(),
+            "throughput": self.throughput,
+            "cpu_utilization": self.utilization,
+            "idle_time": self.idle_time,
+        }
+
+    @property
+    def avg_waiting_time(self):
+        return self.total_waiting_time / self.count if self.count else 0.0
+
+    @property
+    def avg_turnaround_time(self):
+        return self.total_turnaround_time / self.count if self.count else 0.0
+
+
+class Scheduler:
+    """
+    Common base for the scheduling algorithms.
+    Subclasses implement _engine(jobs, timeline): a generator that consumes jobs
+    (index, name, arrival_time, burst_time, priority) in arrival order, pulling each
+    one only when the simulation reaches its arrival, and yields (job, completion_time)
+    as processes finish. Slices are appended to timeline unless it is None.
+    run() and schedule() drive the engine over a full process list; stream() drives
+    it over any arrival-sorted iterable with memory bounded by the ready queue.
+
+    Engines pull arrivals into their ready queue with _admit() and let the CPU idle
+    until the next arrival with _idle_until(), and report every dispatch through
+    _context_switch(), which charges
+    switch_cost time units (as a "Switch" timeline entry) whenever the CPU goes
+    straight from one process to a different one. A dispatch onto an idle CPU is free.
+
+    Setting probe to an instrumentation.Instrumentation turns on the engines'
+    counters, selection timers and per-slice hook; with None they cost next to nothing.
+
+    With checkpoint_spacing set, engines that support it (FCFS, RR, Priority, SJF and
+    SRTF) record a Checkpoint in self.checkpoints at the first dispatch at least that
+    much simulated time after the previous one; IncrementalScheduler resumes from them.
+    """
+    show_priority = False
+    cores = 1
+    slice_cores = None  # Core that ran each timeline entry, for multi-CPU schedulers
+    probe = None
+    checkpoint_spacing = None  # Simulated time between busy-period checkpoints; None records none
+    _heartbeat = None  # Called on every dispatch while run() reports progress
+    _resume = None  # (time, ready entries with job tuples) while run() resumes from a Checkpoint
+    _next_checkpoint = INFINITY
+
+    def __init__(self, switch_cost=0):
+        if switch_cost < 0:
+            raise ValueError("Context switch cost cannot be negative")
+        self.switch_cost = switch_cost
+        self.context_switches = 0
+        self.switch_time = 0
+        self.migration_time = 0
+        self._last_run = None  # Process that last had the CPU; None after an idle gap
+        self.current_time = 0
+        self.total_waiting_time = 0
+        self.total_turnaround_time = 0
+        self.execution_sequence = []  # Store the execution sequence for Gantt chart
+        self.stats = RunningStats()
+
+    def _engine(self, jobs, timeline):
+        raise NotImplementedError
+
+    def _reset_switches(self):
+        self.context_switches = 0
+        self.switch_time = 0
+        self._last_run = None
+        self._first_start = {}  # Job index -> first time it got the CPU, until it completes
+
+    def _admit(self, jobs, pending, current_time, enqueue):
+        """
+        Hand every job arriving by current_time, starting with `pending`, to enqueue(job),
+        pulling them from the arrival-ordered jobs iterator. Return the first job that
+        has not arrived yet, or None when the input is exhausted.
+        """
+        probe = self.probe
+        while pending is not None and pending[2] <= current_time:
+            enqueue(pending)
+            if probe is not None:
+                probe.counters["enqueues"] += 1
+            pending = next(jobs, None)
+        return pending
+
+    def _idle_until(self, current_time, arrival_time, timeline):
+        """Leave the CPU idle from current_time until the next arrival and return that time."""
+        if timeline is not None:
+            timeline.append(("Idle", current_time, arrival_time))
+        self._last_run = None  # Dispatching after an idle gap is not a context switch
+        if self.probe is not None:
+            self.probe.counters["idle_jumps"] += 1
+        return arrival_time
+
+    def _checkpoint(self, current_time, timeline, ready):
+        """
+        Record a Checkpoint at a dispatch boundary, with the waiting jobs in `ready`
+        (or None, see Checkpoint), and return the time of the next one.
+        """
+        self.checkpoints.append(Checkpoint(current_time, len(timeline) if timeline is not None else 0,
+                                           len(self._finish_order), self._last_run, ready, dict(self._first_start)))
+        return current_time + self.checkpoint_spacing
+
+    def _context_switch(self, job, current_time, timeline):
+        """Dispatch `job` at current_time and return when it actually starts running."""
+        name = job[1]
+        last = self._last_run
+        self._last_run = name
+        if last is not None and last != name:
+            self.context_switches += 1
+            if self.switch_cost:
+                self.switch_time += self.switch_cost
+                if timeline is not None:
+                    timeline.append(("Switch", current_time, current_time + self.switch_cost))
+                current_time += self.switch_cost
+        self._first_start.setdefault(job[0], current_time)
+        if self.probe is not None:
+            self.probe.counters["dispatches"] += 1
+        if self._heartbeat is not None:
+            self._heartbeat()
+        return current_time
+
+    def run(self, processes, progress=None, progress_interval=None, timeline=None, resume=None):
+        """
+        Return (completion_times, finish_order, timeline) for a list of processes or a ProcessTable.
+        If given, progress(completed, total) is called every `progress_interval` completions
+        (by default about a hundred times per run) and, between completions, at least every
+        PROGRESS_SECONDS of wall-clock time, checked at each dispatch. It may raise
+        ScheduleCancelled to stop the run. Slices are appended to `timeline` (a new list by
+        default), which is also exposed as execution_sequence while the run is in progress.
+        With `resume`, a Checkpoint whose process indices refer to `processes`, the engine
+        starts from that state; processes must then be its waiting jobs plus the ones
+        arriving after it.
+        """
+        names, arrivals, bursts, priorities = process_columns(processes)
+        n = len(names)
+        order = sorted(range(n), key=arrivals.__getitem__)
+        if resume is not None:
+            ready = resume.ready
+            if ready is not None:
+                # Waiting jobs are seeded into the engine's ready queue instead of arriving again
+                seeded = {entry[0] for entry in ready}
+                order = [i for i in order if i not in seeded]
+                ready = [((i, names[i], arrivals[i], bursts[i], priorities[i]),) + tuple(rest)
+                         for i, *rest in ready]
+            self._resume = (resume.time, ready)
+        jobs = ((i, names[i], arrivals[i], bursts[i], priorities[i]) for i in order)
+        completion_times = [0] * n
+        self.start_times = start_times = [0] * n
+        finish_order = []
+        if timeline is None:
+            timeline = []
+        self.execution_sequence = timeline
+        self._reset_switches()
+        first_start = self._first_start
+        if resume is not None:
+            self._last_run = resume.last_run
+            first_start.update(resume.first_start)
+        self.checkpoints = []
+        self._finish_order = finish_order
+        if self.checkpoint_spacing is not None and n:
+            start = resume.time if resume is not None else arrivals[order[0]]
+            self._next_checkpoint = start + self.checkpoint_spacing
+        probe = self.probe
+        if probe is not None:
+            started = perf_counter()
+            delivered = len(timeline)
+        if progress is not None:
+            if progress_interval is None:
+                progress_interval = max(1, n // 100)
+            next_report = perf_counter() + PROGRESS_SECONDS
+            countdown = 1
+
+            def heartbeat():
+                # Long stretches between completions must not hold up progress or cancellation;
+                # the clock is only read every 256 dispatches
+                nonlocal next_report, countdown
+                countdown -= 1
+                if countdown:
+                    return
+                countdown = 256
+                now = perf_counter()
+                if now >= next_report:
+                    next_report = now + PROGRESS_SECONDS
+                    progress(len(finish_order), n)
+            self._heartbeat = heartbeat
+
+        try:
+            for job, completion_time in self._engine(jobs, timeline):
+                completion_times[job[0]] = completion_time
+                start_times[job[0]] = first_start.pop(job[0])
+                finish_order.append(job[0])
+                if probe is not None:
+                    delivered = probe.drain(timeline, delivered, self.slice_cores)
+                if progress is not None and len(finish_order) % progress_interval == 0:
+                    progress(len(finish_order), n)
+        finally:
+            self._heartbeat = None
+            self._resume = None
+            self._next_checkpoint = INFINITY
+
+        if probe is not None:
+            probe.drain(timeline, delivered, self.slice_cores)
+            probe.add_time("run", started)
+        if progress is not None:
+            progress(n, n)
+        return completion_times, finish_order, timeline
+
+    def schedule(self, processes, progress=None):
+        if not processes:
+            return ScheduleResult([], [], [], [])
+
+        completion_times, finish_order, timeline = self.run(processes, progress)
+        result = ScheduleResult(processes, completion_times, finish_order, timeline,
+                                show_priority=self.show_priority, start_times=self.start_times)
+        result.probe = self.probe
+        self.total_waiting_time = result.total_waiting_time
+        self.total_turnaround_time = result.total_turnaround_time
+        return result
+
+    def stream(self, processes):
+        """
+        Schedule an arrival-sorted iterable of processes (e.g. traces.read_trace())
+        incrementally, yielding a CompletedProcess as each one finishes. Nothing but
+        the ready queue is held in memory; self.stats keeps the running aggregates.
+        """
+        self.stats = stats = RunningStats(self.cores)
+        self._reset_switches()
+        first_start = self._first_start
+        probe = self.probe
+        # Slices are only produced for the probe, and trimmed as they are delivered
+        timeline = [] if probe is not None else None
+        if probe is not None:
+            started = perf_counter()
+        for job, completion_time in self._engine(self._stream_jobs(processes), timeline):
+            record = CompletedProcess(job[1], job[2], job[3], job[4], completion_time, first_start.pop(job[0]))
+            stats.add(record)
+            stats.overhead_time = self.switch_time + self.migration_time
+            if probe is not None:
+                probe.drain(timeline, 0, self.slice_cores)
+                timeline.clear()
+                if self.slice_cores is not None:
+                    self.slice_cores.clear()
+            yield record
+        if probe is not None:
+            probe.drain(timeline, 0, self.slice_cores)
+            probe.add_time("run", started)
+        self.total_waiting_time = stats.total_waiting_time
+        self.total_turnaround_time = stats.total_turnaround_time
+
+    @staticmethod
+    def _stream_jobs(processes):
+        last_arrival = None
+        for i, process in enumerate(processes):
+            arrival_time = process.arrival_time
+            if last_arrival is not None and arrival_time < last_arrival:
+                raise ValueError(f"Trace is not sorted by arrival time at process {process.name!r}")
+            last_arrival = arrival_time
+            yield i, process.name, arrival_time, process.burst_time, process.priority
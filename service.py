@@ -0,0 +1,351 @@
+"""
+Local scheduling service: python -m service [--port PORT | --unix PATH] [options]
+
+An asyncio HTTP/1.1 server for tools that want schedules without embedding the GUI.
+
+    POST /schedule   {"algorithm": "RR", "params": {"quantum_time": 4},
+                      "trace": "/path/to/trace.csv"            (or)
+                      "processes": [{"name": "P1", "arrival_time": 0, "burst_time": 5, "priority": 1}, ...],
+                      "timeline": false}
+    GET  /health
+
+/schedule answers with chunked NDJSON: a "summary" line (averages, percentiles,
+throughput, utilization, context switches), one "process" line per process in
+finish order, optionally one "slice" line per timeline entry, and an "end" line.
+
+Simulations run on a process pool and write their output to a temporary file
+that is streamed back chunk by chunk, waiting on slow readers, so results never
+sit in memory. Identical requests in flight (same workload, algorithm, parameters
+and options) share one simulation. At most max_requests requests are admitted at a
+time; later connections are not read until a slot frees up, so a burst of large
+uploads waits in the kernel's socket buffers instead of in this process. Uploads
+that are being read, parsed or simulated also share a budget of max_buffered_bytes
+(by Content-Length): a request whose body does not fit waits before reading it,
+though a lone upload is always let through.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms import ALGORITHMS, create_scheduler
+
+MAX_HEADER_BYTES = 64 * 1024
+DEFAULT_MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_BUFFERED_BYTES = 256 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+
+
+class RequestError(Exception):
+    """A failed request, answered with `status` and a JSON error body."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _simulate(algorithm, params, source, include_timeline, output_dir):
+    """
+    Process-pool worker: schedule one workload, write its NDJSON body lines to a
+    file in output_dir, and return (path, summary line). Problems with the request's
+    input (an unreadable or malformed trace, parameters the scheduler rejects or
+    cannot use, such as a string quantum) are raised as ValueError; anything else is
+    a server error.
+    """
+    from cli import load_trace, summary
+    from process import ProcessTable
+
+    kind, value = source
+    if kind == "trace":
+        try:
+            processes = load_trace(value)
+        except OSError as e:
+            raise ValueError(f"Cannot read trace: {e}") from None
+    else:
+        processes = ProcessTable(*zip(*value)) if value else ProcessTable()
+    try:
+        result = create_scheduler(algorithm, **params).schedule(processes)
+    except TypeError as e:
+        # Constructors take JSON parameters as given; a wrong type only fails once they are used
+        raise ValueError(f"Invalid parameters for {algorithm}: {e}") from None
+
+    # Same metrics as the command line's JSON output
+    metrics = {"type": "summary", "params": params}
+    metrics.update(summary(algorithm, len(result), result.avg_waiting_time, result.avg_turnaround_time,
+                           int(max(result.completion_times, default=0)), result.context_switches, result.switch_time))
+    if hasattr(result, "utilization"):
+        metrics["cores"] = result.cores
+        metrics["migrations"] = result.migrations
+        metrics["migration_time"] = result.migration_time
+        metrics["core_utilization"] = result.utilization
+    metrics.update(result.stats.to_dict())
+
+    fd, path = tempfile.mkstemp(dir=output_dir, suffix=".ndjson")
+    with os.fdopen(fd, "w") as f:
+        # int() throughout: memory-mapped traces may hand out NumPy integers, which json rejects
+        for i in result.finish_order:
+            process = result.processes[i]
+            f.write(json.dumps({
+                "type": "process", "name": str(process.name), "arrival_time": int(process.arrival_time),
+                "burst_time": int(process.burst_time), "priority": int(process.priority),
+                "completion_time": int(result.completion_times[i]), "waiting_time": int(result.waiting_times[i]),
+                "turnaround_time": int(result.turnaround_times[i]), "response_time": int(result.response_times[i]),
+            }) + "\n")
+        if include_timeline:
+            for name, start_time, end_time in result.timeline:
+                f.write(json.dumps({"type": "slice", "name": name, "start": int(start_time),
+                                    "end": int(end_time)}) + "\n")
+    return path, json.dumps(metrics) + "\n"
+
+
+class SchedulingService:
+    def __init__(self, max_workers=None, max_requests=None, max_upload_bytes=DEFAULT_MAX_UPLOAD_BYTES,
+                 max_buffered_bytes=DEFAULT_MAX_BUFFERED_BYTES):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_upload_bytes = max_upload_bytes
+        # Admission limit: requests beyond it are not read until a slot frees up
+        self.admission = asyncio.Semaphore(max_requests or self.max_workers * 4)
+        # Byte budget for uploads held in this process, from reading until their simulation ends
+        self.max_buffered_bytes = max_buffered_bytes
+        self.buffered_bytes = 0
+        self.buffer_freed = asyncio.Event()
+        self.executor = None
+        self.output_dir = None
+        self.inflight = {}  # Job key -> [task producing (path, summary), number of requests using it]
+        self.simulations = 0
+        self.coalesced = 0
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        # Spawned, not forked: workers started on demand would otherwise inherit open client
+        # sockets and keep those connections from closing
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self.output_dir = tempfile.TemporaryDirectory(prefix="cpu-service-")
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self.handle, path=unix_path, limit=MAX_HEADER_BYTES)
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+        if self.output_dir is not None:
+            self.output_dir.cleanup()
+
+    async def handle(self, reader, writer):
+        try:
+            async with self.admission:
+                try:
+                    method, path, headers = await self.read_head(reader)
+                    if method == "GET" and path == "/health":
+                        await self.respond_json(writer, 200, {
+                            "status": "ok", "inflight": len(self.inflight),
+                            "simulations": self.simulations, "coalesced": self.coalesced,
+                        })
+                    elif method == "POST" and path == "/schedule":
+                        await self.schedule(reader, writer, headers)
+                    else:
+                        raise RequestError(404, f"No route for {method} {path}")
+                except RequestError as e:
+                    await self.respond_json(writer, e.status, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away
+        finally:
+            writer.close()
+
+    async def read_head(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise RequestError(431, "Request headers too large") from None
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise RequestError(400, "Malformed request line") from None
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        return method, path, headers
+
+    def content_length(self, headers):
+        try:
+            length = int(headers["content-length"])
+        except (KeyError, ValueError):
+            raise RequestError(411, "Content-Length required") from None
+        if length < 0:
+            raise RequestError(400, "Invalid Content-Length")
+        if length > self.max_upload_bytes:
+            raise RequestError(413, f"Upload exceeds {self.max_upload_bytes} bytes")
+        return length
+
+    async def read_body(self, reader, length):
+        try:
+            return json.loads(await reader.readexactly(length))
+        except ValueError:
+            raise RequestError(400, "Body is not valid JSON") from None
+
+    async def reserve(self, length):
+        """Wait until `length` more bytes fit in the upload budget (or nothing else is held), then take them."""
+        while self.buffered_bytes and self.buffered_bytes + length > self.max_buffered_bytes:
+            self.buffer_freed.clear()
+            await self.buffer_freed.wait()
+        self.buffered_bytes += length
+
+    def release(self, length):
+        if length:
+            self.buffered_bytes -= length
+            self.buffer_freed.set()
+
+    def parse_job(self, body):
+        """Validate a request body and return (key, algorithm, params, source, include_timeline)."""
+        if not isinstance(body, dict):
+            raise RequestError(400, "Body must be a JSON object")
+        algorithm = body.get("algorithm", "FCFS")
+        params = body.get("params") or {}
+        if algorithm not in ALGORITHMS:
+            raise RequestError(400, f"Unknown scheduling algorithm: {algorithm}")
+        if not isinstance(params, dict):
+            raise RequestError(400, "params must be an object")
+        try:
+            create_scheduler(algorithm, **params)
+        except (TypeError, ValueError) as e:
+            raise RequestError(400, f"Invalid parameters for {algorithm}: {e}") from None
+        include_timeline = bool(body.get("timeline", False))
+
+        hasher = hashlib.blake2b(digest_size=16)
+        if "trace" in body:
+            path = body["trace"]
+            try:
+                stat = os.stat(path)
+            except (OSError, TypeError) as e:
+                raise RequestError(400, f"Cannot read trace: {e}") from None
+            source = ("trace", path)
+            # Same file, unchanged since: same workload
+            hasher.update(repr((os.path.abspath(path), stat.st_size, stat.st_mtime_ns)).encode())
+        elif "processes" in body:
+            try:
+                rows = [(str(p["name"]), int(p["arrival_time"]), int(p["burst_time"]), int(p.get("priority", 0)))
+                        for p in body["processes"]]
+            except (KeyError, TypeError, ValueError) as e:
+                raise RequestError(400, f"Invalid process record: {e}") from None
+            source = ("processes", rows)
+            hasher.update(repr(rows).encode())
+        else:
+            raise RequestError(400, "Request needs a trace path or a processes list")
+        hasher.update(repr((algorithm, sorted(params.items()), include_timeline)).encode())
+        return hasher.hexdigest(), algorithm, params, source, include_timeline
+
+    async def schedule(self, reader, writer, headers):
+        length = self.content_length(headers)
+        await self.reserve(length)
+        try:
+            # The decoded body is dropped as soon as the job is parsed out of it
+            key, algorithm, params, source, include_timeline = self.parse_job(await self.read_body(reader, length))
+            entry = self.inflight.get(key)
+            if entry is None:
+                loop = asyncio.get_running_loop()
+                try:
+                    task = loop.run_in_executor(self.executor, _simulate, algorithm, params, source,
+                                                include_timeline, self.output_dir.name)
+                except RuntimeError as e:  # Includes BrokenProcessPool
+                    raise RequestError(500, f"Cannot start simulation: {e}") from None
+                # The pool keeps the uploaded processes until the simulation ends, and so does the budget
+                task.add_done_callback(lambda _, length=length: self.release(length))
+                length = 0
+                entry = self.inflight[key] = [task, 0]
+                self.simulations += 1
+            else:
+                self.coalesced += 1
+        finally:
+            self.release(length)
+        del source  # Uploaded processes are only needed by the worker
+        entry[1] += 1
+        try:
+            try:
+                path, summary = await asyncio.shield(entry[0])
+            except ValueError as e:
+                raise RequestError(400, f"Scheduling failed: {e}") from None
+            except Exception as e:
+                # The worker or the pool broke, not the request
+                raise RequestError(500, f"Scheduling failed: {type(e).__name__}: {e}") from None
+            await self.stream(writer, path, summary)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                # Last reader: forget the job and remove its output
+                del self.inflight[key]
+                if entry[0].done() and not entry[0].cancelled() and entry[0].exception() is None:
+                    os.unlink(entry[0].result()[0])
+
+    async def stream(self, writer, path, summary):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        self.write_chunk(writer, summary.encode())
+        loop = asyncio.get_running_loop()
+        with open(path, "rb") as f:
+            while True:
+                # Whole lines of about CHUNK_BYTES, read off the event loop
+                lines = await loop.run_in_executor(None, f.readlines, CHUNK_BYTES)
+                if not lines:
+                    break
+                self.write_chunk(writer, b"".join(lines))
+                await writer.drain()  # Wait for slow clients instead of buffering their output
+        self.write_chunk(writer, b'{"type": "end"}\n')
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def write_chunk(writer, data):
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    @staticmethod
+    async def respond_json(writer, status, payload):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 411: "Length Required",
+                   413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+        body = json.dumps(payload).encode()
+        writer.write(f"HTTP/1.1 {status} {reasons.get(status, '')}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+
+
+async def serve(args):
+    service = SchedulingService(args.workers, args.max_requests, args.max_upload_mb * 1024 * 1024,
+                                args.max_buffered_mb * 1024 * 1024)
+    server = await service.start(args.host, args.port, args.unix)
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Scheduling service listening on {where}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m service", description="Serve scheduling runs over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="simulation processes (default: CPU count)")
+    parser.add_argument("--max-requests", type=int, default=None,
+                        help="requests admitted at once (default: 4 per worker)")
+    parser.add_argument("--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_BYTES // (1024 * 1024))
+    parser.add_argument("--max-buffered-mb", type=int, default=DEFAULT_MAX_BUFFERED_BYTES // (1024 * 1024),
+                        help="upload bytes held at once across requests until their simulations end")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import heapq
+
+from scheduler import Scheduler
+
+
+class SJF(Scheduler):
+    def _engine(self, jobs, timeline):
+        """
+        Non-preemptive Shortest-Job-First: whenever the CPU frees up, run the ready
+        process with the smallest burst (ties by arrival, then input order).
+        Ready processes live in a heap keyed on burst time, so the run is O(n log n).
+        """
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        ready_heap = []  # (burst_time, arrival_time, index, job) entries
+        if self._resume is not None:
+            current_time, ready = self._resume
+            ready_heap = [(job[3], job[2], job[0], job) for job, in ready]
+            heapq.heapify(ready_heap)
+        elif pending is None:
+            return
+        else:
+            current_time = pending[2]
+        next_checkpoint = self._next_checkpoint
+
+        def enqueue(job):
+            heapq.heappush(ready_heap, (job[3], job[2], job[0], job))
+
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+            if not ready_heap:
+                if pending is None:
+                    break
+                current_time = self._idle_until(current_time, pending[2], timeline)
+                continue
+
+            if current_time >= next_checkpoint:
+                next_checkpoint = self._checkpoint(current_time, timeline, [(entry[2],) for entry in ready_heap])
+            if probe is None:
+                job = heapq.heappop(ready_heap)[3]
+            else:
+                job = probe.timed("select", heapq.heappop, ready_heap)[3]
+            start_time = current_time = self._context_switch(job, current_time, timeline)
+            current_time += job[3]
+            self.current_time = current_time
+            if timeline is not None:
+                timeline.append((job[1], start_time, current_time))
+            yield job, current_time
+
+
+class SRTF(Scheduler):
+    def _engine(self, jobs, timeline):
+        """
+        Shortest-Remaining-Time-First, the preemptive form of SJF: an arriving process
+        preempts the running one if its burst is strictly shorter than what the running
+        process has left. Ready processes live in a heap keyed on remaining time and the
+        running process is only re-examined at arrivals, so the run is O(n log n).
+        """
+        probe = self.probe
+        jobs = iter(jobs)
+        pending = next(jobs, None)  # Next job that has not been admitted yet
+        ready_heap = []  # (remaining_time, arrival_time, index, job) entries
+        if self._resume is not None:
+            current_time, ready = self._resume
+            ready_heap = [(remaining, job[2], job[0], job) for job, remaining in ready]
+            heapq.heapify(ready_heap)
+        elif pending is None:
+            return
+        else:
+            current_time = pending[2]
+        next_checkpoint = self._next_checkpoint
+        running = None
+        remaining = 0
+        slice_start = None
+
+        def enqueue(job):
+            heapq.heappush(ready_heap, (job[3], job[2], job[0], job))
+
+        while True:
+            pending = self._admit(jobs, pending, current_time, enqueue)
+
+            if running is not None and ready_heap and ready_heap[0][0] < remaining:
+                # A shorter job is ready: preempt
+                if timeline is not None and slice_start < current_time:
+                    timeline.append((running[1], slice_start, current_time))
+                heapq.heappush(ready_heap, (remaining, running[2], running[0], running))
+                if probe is not None:
+                    probe.counters["enqueues"] += 1
+                running = None
+
+            if running is None:
+                if not ready_heap:
+                    if pending is None:
+                        break
+                    current_time = self._idle_until(current_time, pending[2], timeline)
+                    continue
+                if current_time >= next_checkpoint:
+                    next_checkpoint = self._checkpoint(current_time, timeline,
+                                                       [(entry[2], entry[0]) for entry in ready_heap])
+                if probe is None:
+                    remaining, _, _, running = heapq.heappop(ready_heap)
+                else:
+                    remaining, _, _, running = probe.timed("select", heapq.heappop, ready_heap)
+                slice_start = current_time = self._context_switch(running, current_time, timeline)
+
+            # Run until completion or the next arrival, whichever comes first
+            end_time = current_time + remaining
+            if pending is not None and pending[2] < end_time:
+                # An arrival during the context switch is handled as soon as it ends
+                end_time = max(pending[2], current_time)
+            remaining -= end_time - current_time
+            current_time = end_time
+            self.current_time = current_time
+
+            if remaining == 0:
+                if timeline is not None:
+                    timeline.append((running[1], slice_start, current_time))
+                job, running = running, None
+                yield job, current_time
@@ -0,0 +1,122 @@
+import csv
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms import create_scheduler
+from cache import ResultCache, workload_fingerprint
+from traces import is_binary_trace, open_binary_trace, read_trace, write_binary_trace
+
+SWEEP_FIELDS = ("trace", "algorithm", "params", "processes", "avg_waiting_time",
+                "avg_turnaround_time", "max_waiting_time", "p95_waiting_time", "p99_waiting_time",
+                "p99_turnaround_time", "p99_response_time", "throughput", "cpu_utilization", "makespan",
+                "context_switches", "switch_time")
+
+_open_traces = {}  # Per-worker cache of memory-mapped traces
+
+
+def build_jobs(traces, algorithms=("FCFS", "RR", "Priority"), quanta=(2,), priority_params=({},), switch_costs=(0,)):
+    """
+    Expand traces x algorithms (x quanta for RR, x priority_params for Priority)
+    x context-switch costs into sweep jobs.
+    """
+    jobs = []
+    for trace in traces:
+        for algorithm in algorithms:
+            if algorithm == "RR":
+                param_sets = [{"quantum_time": quantum} for quantum in quanta]
+            elif algorithm == "Priority":
+                param_sets = [dict(params) for params in priority_params]
+            else:
+                param_sets = [{}]
+            for switch_cost in switch_costs:
+                jobs.extend((algorithm, {**params, "switch_cost": switch_cost} if switch_cost else params, trace)
+                            for params in param_sets)
+    return jobs
+
+
+def _run_job(job):
+    algorithm, params, trace = job
+    table = _open_traces.get(trace)
+    if table is None:
+        table = _open_traces[trace] = open_binary_trace(trace)
+
+    result = create_scheduler(algorithm, **params).schedule(table)
+    stats = result.stats
+    return {
+        "algorithm": algorithm,
+        "params": params,
+        "processes": len(result),
+        "avg_waiting_time": result.avg_waiting_time,
+        "avg_turnaround_time": result.avg_turnaround_time,
+        "max_waiting_time": max(result.waiting_times, default=0),
+        "p95_waiting_time": stats.waiting.percentile(95),
+        "p99_waiting_time": stats.waiting.percentile(99),
+        "p99_turnaround_time": stats.turnaround.percentile(99),
+        "p99_response_time": stats.response.percentile(99),
+        "throughput": stats.throughput,
+        "cpu_utilization": stats.utilization,
+        "makespan": max(result.completion_times, default=0),
+        "context_switches": result.context_switches,
+        "switch_time": result.switch_time,
+    }
+
+
+def run_sweep(jobs, max_workers=None, cache_dir=None):
+    """
+    Run (algorithm, params, trace_path) jobs over a ProcessPoolExecutor and return one
+    result row per job, in job order. Text traces are converted once to the binary
+    format; workers memory-map the binary files, so every worker shares the same
+    page-cache copy of a workload instead of receiving pickled Process lists.
+    With cache_dir, rows are memoized on disk by trace contents, algorithm and
+    parameters, and only the jobs without a cached row are run.
+    """
+    jobs = list(jobs)
+    binary_paths = {}
+    temp_dir = None
+    try:
+        for _, _, trace in jobs:
+            if trace in binary_paths:
+                continue
+            if is_binary_trace(trace):
+                binary_paths[trace] = trace
+            else:
+                if temp_dir is None:
+                    temp_dir = tempfile.TemporaryDirectory(prefix="cpu-sweep-")
+                binary_path = os.path.join(temp_dir.name, f"{len(binary_paths)}.bin")
+                write_binary_trace(binary_path, read_trace(trace))
+                binary_paths[trace] = binary_path
+
+        worker_jobs = [(algorithm, params, binary_paths[trace]) for algorithm, params, trace in jobs]
+        rows = [None] * len(worker_jobs)
+        if cache_dir is not None:
+            cache = ResultCache(max_entries=0, directory=cache_dir, namespace="sweep-row")
+            fingerprints = {path: workload_fingerprint(open_binary_trace(path)) for path in set(binary_paths.values())}
+            keys = [(fingerprints[path], algorithm, params) for algorithm, params, path in worker_jobs]
+            rows = [cache.get(*key) for key in keys]
+        todo = [i for i, row in enumerate(rows) if row is None]
+
+        if todo:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(todo) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for i, row in zip(todo, executor.map(_run_job, [worker_jobs[i] for i in todo], chunksize=chunksize)):
+                    rows[i] = row
+                    if cache_dir is not None:
+                        cache.put(*keys[i], row)
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    for row, (_, _, trace) in zip(rows, jobs):
+        row["trace"] = trace
+    return rows
+
+
+def write_sweep_csv(path, rows):
+    """Write sweep result rows as one CSV table."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SWEEP_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "params": ";".join(f"{k}={v}" for k, v in row["params"].items())})
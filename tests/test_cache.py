@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from cache import ResultCache, workload_fingerprint
+from fcfs import FCFS
+from process import Process, ProcessTable
+from traces import open_binary_trace, write_binary_trace
+from workloads import workload
+
+
+def test_fingerprint_identifies_the_workload():
+    processes = workload(3)
+    fingerprint = workload_fingerprint(processes)
+    assert workload_fingerprint(workload(3)) == fingerprint
+    assert workload_fingerprint(ProcessTable.from_processes(processes)) == fingerprint
+    assert workload_fingerprint(processes[::-1]) != fingerprint
+
+
+@pytest.mark.parametrize("field, value", [("name", "renamed"), ("arrival_time", 1000), ("burst_time", 100),
+                                          ("priority", 9)])
+def test_fingerprint_changes_when_a_process_is_edited(field, value):
+    processes = workload(3)
+    fingerprint = workload_fingerprint(processes)
+    setattr(processes[0], field, value)
+    assert workload_fingerprint(processes) != fingerprint
+
+
+def test_binary_trace_fingerprint_follows_the_file(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    write_binary_trace(path, workload(3))
+    fingerprint = workload_fingerprint(open_binary_trace(path))
+    assert workload_fingerprint(open_binary_trace(path)) == fingerprint
+    write_binary_trace(path, workload(4))
+    assert workload_fingerprint(open_binary_trace(path)) != fingerprint
+
+
+def test_hit_is_attached_to_the_callers_processes():
+    processes = workload(3)
+    fingerprint = workload_fingerprint(processes)
+    cache = ResultCache()
+    result = FCFS().schedule(processes)
+    cache.put(fingerprint, "FCFS", {}, result)
+    assert result.processes is processes  # The caller's result is left alone
+
+    same = workload(3)
+    cached = cache.get(fingerprint, "FCFS", {}, same)
+    assert cached.processes is same
+    assert cached.completion_times == result.completion_times
+    assert cache.get(fingerprint, "FCFS", {"switch_cost": 1}) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_invalidate_drops_every_entry_of_one_workload(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put("a", "FCFS", {}, 1)
+    cache.put("a", "RR", {"quantum_time": 2}, 2)
+    cache.put("b", "FCFS", {}, 3)
+    cache.invalidate("a")
+    assert len(cache) == 1
+    assert len(os.listdir(tmp_path)) == 1
+    assert cache.get("a", "FCFS", {}) is None
+    assert cache.get("a", "RR", {"quantum_time": 2}) is None
+    assert cache.get("b", "FCFS", {}) == 3
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", "FCFS", {}, 1)
+    cache.put("b", "FCFS", {}, 2)
+    assert cache.get("a", "FCFS", {}) == 1
+    cache.put("c", "FCFS", {}, 3)
+    assert cache.get("b", "FCFS", {}) is None
+    assert cache.get("a", "FCFS", {}) == 1
+    assert cache.get("c", "FCFS", {}) == 3
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    ResultCache(directory=str(tmp_path)).put("a", "FCFS", {}, {"row": 1})
+    cache = ResultCache(max_entries=0, directory=str(tmp_path))
+    assert cache.get("a", "FCFS", {}) == {"row": 1}
+    assert len(cache) == 0  # max_entries=0 keeps nothing in memory
+    assert ResultCache(directory=str(tmp_path), namespace="other").get("a", "FCFS", {}) is None
+
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    cache = ResultCache(max_entries=0, directory=str(tmp_path))
+    cache.put("a", "FCFS", {}, 1)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"not a pickle")
+    assert cache.get("a", "FCFS", {}) is None
+
+
+def test_rejects_a_negative_size():
+    with pytest.raises(ValueError):
+        ResultCache(max_entries=-1)
+
+
+def test_edited_process_does_not_change_the_cached_result():
+    processes = [Process("A", 0, 3, 0), Process("B", 1, 2, 0)]
+    cache = ResultCache()
+    cache.put(workload_fingerprint(processes), "FCFS", {}, FCFS().schedule(processes))
+    processes[0].burst_time = 10
+    assert cache.get(workload_fingerprint(processes), "FCFS", {}, processes) is None
@@ -0,0 +1,33 @@
+from cfs import CFS, NICE_0_WEIGHT
+from incremental import IncrementalScheduler
+from process import Process
+
+
+def test_weights_follow_the_kernel_table():
+    assert CFS.weight(0) == NICE_0_WEIGHT
+    assert [CFS.weight(priority) for priority in range(1, 5)] == [820, 655, 526, 423]
+    assert CFS.weight(-20) == CFS.weight(-25) == 88761
+    assert CFS.weight(19) == CFS.weight(40) == 15
+
+
+def test_heavier_process_gets_the_longer_slice():
+    processes = [Process("A", 0, 30, 0), Process("B", 0, 30, 5)]
+    # A's slice is 24 * 1024 // (1024 + 335) = 18 and B's 24 * 335 // 1359 = 5, but B's
+    # vruntime grows ~3x slower, so it runs two slices back to back before A's turn again
+    assert CFS().schedule(processes).timeline == [("A", 0, 18), ("B", 18, 28), ("A", 28, 40), ("B", 40, 60)]
+
+
+def test_slices_do_not_depend_on_earlier_busy_periods():
+    # Adding and removing these weights used to leave float residue in the total weight,
+    # so after the idle gap the full run cut X and Y's 12-unit slices to 11 while a run
+    # resumed from the gap did not
+    processes = [Process(f"P{i}", 0, 2, priority) for i, priority in enumerate((2, 4, 3, 0, 1, 1, 3))]
+    processes += [Process("X", 100, 20, 0), Process("Y", 100, 20, 0)]
+    incremental = IncrementalScheduler(CFS)
+    incremental.schedule(processes)
+    processes[-1].burst_time = 21
+    incremental.process_changed(100)
+    result = incremental.schedule(processes)
+    expected = CFS().schedule(processes)
+    assert [entry for entry in expected.timeline if entry[1] >= 100][:2] == [("X", 100, 112), ("Y", 112, 124)]
+    assert result.timeline == expected.timeline
@@ -0,0 +1,36 @@
+import pytest
+
+from fcfs import FCFS, fcfs_arrays
+from process import Process
+from workloads import workload
+
+
+def test_serves_in_arrival_order_with_idle_gaps():
+    processes = [Process("A", 4, 2, 0), Process("B", 0, 3, 0), Process("C", 0, 1, 0)]
+    result = FCFS().schedule(processes)
+    assert result.timeline == [("B", 0, 3), ("C", 3, 4), ("A", 4, 6)]
+    processes.append(Process("D", 10, 1, 0))
+    assert FCFS().schedule(processes).timeline[-2:] == [("Idle", 6, 10), ("D", 10, 11)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_arrays_match_fcfs(seed):
+    np = pytest.importorskip("numpy")
+    processes = workload(seed)
+    if seed % 2:
+        processes.sort(key=lambda p: p.arrival_time)  # Exercise the already-sorted shortcut too
+    result = FCFS().schedule(processes)
+    completion_times, waiting_times, turnaround_times = fcfs_arrays(
+        np.array([p.arrival_time for p in processes]), np.array([p.burst_time for p in processes]))
+    assert completion_times.tolist() == result.completion_times
+    assert waiting_times.tolist() == result.waiting_times
+    assert turnaround_times.tolist() == result.turnaround_times
+
+
+def test_arrays_start_the_clock_at_zero():
+    np = pytest.importorskip("numpy")
+    completion_times, waiting_times, _ = fcfs_arrays(np.array([-5, 3, -2]), np.array([2, 1, 2]))
+    assert completion_times.tolist() == [2, 5, 4]
+    assert waiting_times.tolist() == [5, 1, 4]
+    assert FCFS().schedule([Process("A", -5, 2, 0), Process("B", 3, 1, 0),
+                            Process("C", -2, 2, 0)]).completion_times == [2, 5, 4]
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from algorithms import create_scheduler
+from incremental import IncrementalScheduler
+from process import Process
+from rr import RR
+from workloads import CONFIGURATIONS, workload
+
+
+def test_unchanged_workload_returns_the_cached_result():
+    processes = workload(1)
+    incremental = IncrementalScheduler(lambda: RR(2))
+    result = incremental.schedule(processes)
+    assert incremental.schedule(processes) is result
+    # An unreported change in size is noticed and rescheduled from scratch
+    processes.append(Process("late", 500, 1, 0))
+    assert incremental.schedule(processes).completion_times == RR(2).schedule(processes).completion_times
+
+
+def test_change_after_an_idle_gap_only_reschedules_what_follows_it():
+    processes = [Process("A", 0, 3, 0), Process("B", 1, 2, 0), Process("C", 10, 4, 0), Process("D", 11, 1, 0)]
+    runs = []
+
+    def scheduler_factory():
+        runs.append(RR(2))
+        return runs[-1]
+
+    incremental = IncrementalScheduler(scheduler_factory)
+    incremental.schedule(processes)
+    processes[3].burst_time = 5
+    incremental.process_changed(processes[3].arrival_time)
+    result = incremental.schedule(processes)
+    assert result.timeline[:4] == [("A", 0, 2), ("B", 2, 4), ("A", 4, 5), ("Idle", 5, 10)]
+    assert result.timeline == RR(2).schedule(processes).timeline
+    assert len(runs[1].start_times) == 2  # Only C and D ran again
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("algorithm, params", CONFIGURATIONS)
+def test_matches_full_reschedule(seed, algorithm, params):
+    rng = random.Random(seed)
+    # A crowded workload keeps the CPU busy, so resuming also starts from busy-period checkpoints
+    processes = workload(seed, count=60, horizon=rng.choice((60, 300)))
+    incremental = IncrementalScheduler(lambda: create_scheduler(algorithm, **params))
+    for step in range(8):
+        result = incremental.schedule(processes)
+        expected = create_scheduler(algorithm, **params).schedule(processes)
+        assert result.completion_times == expected.completion_times, step
+        assert result.finish_order == expected.finish_order, step
+        assert result.response_times == expected.response_times, step
+        assert result.timeline == expected.timeline, step
+
+        edit = rng.choice(("add", "edit", "remove"))
+        if edit == "add" or len(processes) == 1:
+            process = Process(f"N{step}", rng.randint(0, 320), rng.randint(1, 9), rng.randint(0, 4))
+            processes.append(process)
+            incremental.process_changed(process.arrival_time)
+        elif edit == "edit":
+            process = rng.choice(processes)
+            old_arrival = process.arrival_time
+            process.arrival_time = rng.randint(0, 320)
+            process.burst_time = rng.randint(1, 9)
+            incremental.process_changed(old_arrival, process.arrival_time)
+        else:
+            process = processes.pop(rng.randrange(len(processes)))
+            incremental.process_changed(process.arrival_time)
+
+
+def test_resumes_from_busy_checkpoint():
+    # Bursts average the 3 units between arrivals: after the first gap the CPU never idles,
+    # yet no backlog builds up
+    processes = [Process(f"P{i}", 3 * i, 2 + 2 * (i % 2), i % 3) for i in range(200)]
+    incremental = IncrementalScheduler(lambda: RR(2))
+    incremental.schedule(processes)
+    assert any(state is not None for _, _, state in incremental.checkpoints)
+
+    schedulers = []
+
+    def scheduler_factory():
+        schedulers.append(RR(2))
+        return schedulers[-1]
+
+    incremental.scheduler_factory = scheduler_factory
+    processes[-1].burst_time = 7
+    incremental.process_changed(processes[-1].arrival_time)
+    result = incremental.schedule(processes)
+    assert result.completion_times == RR(2).schedule(processes).completion_times
+    # Only the processes still waiting at the checkpoint or arriving after it ran again
+    assert len(schedulers[0].start_times) < len(processes) // 4
@@ -0,0 +1,69 @@
+import math
+import random
+
+import pytest
+
+from metrics import LatencyHistogram
+
+
+def exact_percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percent / 100 * len(ordered))) - 1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_percentiles_are_within_the_relative_error_bound(seed):
+    rng = random.Random(seed)
+    values = [int(rng.lognormvariate(8, 2)) for _ in range(5000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.add(value)
+    for percent in (1, 10, 50, 90, 95, 99, 99.9, 100):
+        exact = exact_percentile(values, percent)
+        assert abs(histogram.percentile(percent) - exact) <= exact * 2 ** (1 - histogram.precision)
+    assert histogram.count == len(values)
+    assert histogram.total == sum(values)
+    assert (histogram.min, histogram.max) == (min(values), max(values))
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(200):
+        histogram.add(value)
+    assert histogram.summary() == {"p50": 99, "p95": 189, "p99": 197, "max": 199}
+
+
+def test_memory_grows_with_the_value_range_not_the_sample_count():
+    histogram = LatencyHistogram()
+    for value in range(0, 1_000_000, 97):
+        histogram.add(value)
+    assert len(histogram.counts) < 128 * 14
+
+
+def test_merge_matches_one_histogram_over_all_values():
+    rng = random.Random(7)
+    values = [rng.randint(0, 100_000) for _ in range(3000)]
+    whole = LatencyHistogram()
+    shards = [LatencyHistogram() for _ in range(3)]
+    for i, value in enumerate(values):
+        whole.add(value)
+        shards[i % 3].add(value)
+    merged = shards[0].merge(shards[1]).merge(shards[2])
+    assert merged.counts == whole.counts
+    assert (merged.count, merged.total, merged.min, merged.max) == (whole.count, whole.total, whole.min, whole.max)
+    assert merged.summary() == whole.summary()
+
+
+def test_merge_with_an_empty_histogram():
+    histogram = LatencyHistogram()
+    histogram.add(5)
+    assert histogram.merge(LatencyHistogram()).summary() == {"p50": 5, "p95": 5, "p99": 5, "max": 5}
+    assert LatencyHistogram().merge(histogram).min == 5
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        LatencyHistogram().add(-1)
+    with pytest.raises(ValueError):
+        LatencyHistogram(8).merge(LatencyHistogram(6))
+    assert LatencyHistogram().percentile(50) == 0
@@ -0,0 +1,61 @@
+import pytest
+
+from fcfs import FCFS
+from multicore import MultiCore
+from priority import Priority
+from process import Process
+from rr import RR
+from workloads import workload
+
+
+def test_cores_run_in_parallel():
+    processes = [Process("A", 0, 4, 0), Process("B", 0, 2, 0), Process("C", 1, 3, 0)]
+    result = MultiCore(2).schedule(processes)
+    assert result.completion_times == [4, 2, 5]
+    assert result.makespan == 5
+    assert result.core_timelines() == [[("A", 0, 4)], [("B", 0, 2), ("C", 2, 5)]]
+
+
+@pytest.mark.parametrize("queue_mode", ["global", "per-core"])
+def test_preempted_job_resumes_on_its_idle_core(queue_mode):
+    processes = [Process("B", 0, 4, 0), Process("A", 0, 10, 0)]
+    result = MultiCore(2, "RR", quantum_time=4, queue_mode=queue_mode, migration_cost=2).schedule(processes)
+    assert result.migrations == 0
+    assert result.migration_time == 0
+    assert result.core_timelines() == [[("B", 0, 4)], [("A", 0, 4), ("A", 4, 8), ("A", 8, 10)]]
+
+
+def test_core_that_runs_dry_steals_queued_work():
+    processes = [Process("A", 0, 1, 0), Process("B", 0, 20, 0), Process("C", 0, 5, 0), Process("D", 0, 5, 0)]
+    result = MultiCore(2, queue_mode="per-core").schedule(processes)
+    # D was queued behind B on core 1, but core 0 takes it once C is done
+    assert result.core_timelines() == [[("A", 0, 1), ("C", 1, 6), ("D", 6, 11)], [("B", 0, 20)]]
+    assert result.migrations == 0  # D had not run anywhere yet
+
+
+def test_migration_is_charged_when_a_job_moves():
+    processes = [Process("A", 0, 6, 0), Process("B", 0, 3, 0), Process("C", 0, 2, 0)]
+    result = MultiCore(2, "RR", quantum_time=2, migration_cost=1).schedule(processes)
+    warmups = [entry for entry in result.timeline if entry[0] == "Warmup"]
+    assert result.migrations == len(warmups) > 0
+    assert all(end - start == 1 for _, start, end in warmups)
+    assert result.migration_time == result.migrations
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("switch_cost", [0, 2])
+@pytest.mark.parametrize("discipline, scheduler", [
+    ("FCFS", lambda switch_cost: FCFS(switch_cost)),
+    ("RR", lambda switch_cost: RR(3, switch_cost)),
+    ("Priority", lambda switch_cost: Priority(switch_cost=switch_cost)),
+])
+def test_one_core_matches_the_single_cpu_engines(seed, switch_cost, discipline, scheduler):
+    processes = workload(seed)
+    expected = scheduler(switch_cost).schedule(processes)
+    for queue_mode in ("global", "per-core"):
+        result = MultiCore(1, discipline, quantum_time=3, queue_mode=queue_mode,
+                           switch_cost=switch_cost).schedule(processes)
+        assert result.completion_times == expected.completion_times
+        assert result.finish_order == expected.finish_order
+        assert result.response_times == expected.response_times
+        assert result.context_switches == expected.context_switches
@@ -0,0 +1,43 @@
+import pytest
+
+from priority import Priority
+from process import Process
+
+
+def test_lower_number_runs_first_and_ties_go_by_arrival():
+    processes = [Process("A", 0, 2, 1), Process("B", 1, 2, 0), Process("C", 1, 2, 3), Process("D", 2, 2, 0)]
+    result = Priority().schedule(processes)
+    assert [processes[i].name for i in result.finish_order] == ["A", "B", "D", "C"]
+
+
+def test_preemption_needs_a_strictly_better_priority():
+    processes = [Process("A", 0, 6, 2), Process("B", 2, 2, 2), Process("C", 3, 1, 1)]
+    result = Priority(preemptive=True).schedule(processes)
+    assert result.timeline == [("A", 0, 3), ("C", 3, 4), ("A", 4, 7), ("B", 7, 9)]
+
+
+def test_equal_priorities_age_by_whole_levels():
+    # B waits a full aging interval before it is a level ahead of A, and so on back and forth
+    processes = [Process("A", 0, 20, 5), Process("B", 1, 20, 5)]
+    result = Priority(preemptive=True, aging_interval=10).schedule(processes)
+    assert result.timeline == [("A", 0, 11), ("B", 11, 31), ("A", 31, 40)]
+    assert result.context_switches == 2
+
+
+def test_aging_lets_a_waiting_process_overtake():
+    # B (priority 2) reaches level -1, ahead of A's 0, after three intervals of waiting
+    processes = [Process("A", 0, 30, 0), Process("B", 1, 5, 2)]
+    result = Priority(preemptive=True, aging_interval=5).schedule(processes)
+    assert result.timeline == [("A", 0, 16), ("B", 16, 21), ("A", 21, 35)]
+
+
+def test_non_preemptive_aging_orders_dispatches_by_waiting_time():
+    # C has waited 12 units (two levels) by t=13, so at level 1 it beats B's 2
+    processes = [Process("A", 0, 13, 0), Process("B", 12, 1, 2), Process("C", 1, 1, 3)]
+    result = Priority(aging_interval=6).schedule(processes)
+    assert [processes[i].name for i in result.finish_order] == ["A", "C", "B"]
+
+
+def test_aging_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        Priority(aging_interval=0).schedule([Process("A", 0, 1, 0)])
@@ -0,0 +1,64 @@
+from collections import deque
+
+import pytest
+
+from process import Process
+from rr import RR
+from workloads import workload
+
+
+def reference_rr(processes, quantum):
+    """Completion times from a slice-by-slice Round Robin, as the engine replaced by the event-driven one ran it."""
+    order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    remaining = [p.burst_time for p in processes]
+    completion_times = [0] * len(processes)
+    ready_queue = deque()
+    admitted = 0
+    current_time = 0
+
+    def admit():
+        nonlocal admitted
+        while admitted < len(order) and processes[order[admitted]].arrival_time <= current_time:
+            ready_queue.append(order[admitted])
+            admitted += 1
+
+    while admitted < len(order) or ready_queue:
+        admit()
+        if not ready_queue:
+            current_time = processes[order[admitted]].arrival_time
+            continue
+        i = ready_queue.popleft()
+        run_time = min(quantum, remaining[i])
+        current_time += run_time
+        remaining[i] -= run_time
+        admit()  # Arrivals during the slice queue ahead of the preempted process
+        if remaining[i]:
+            ready_queue.append(i)
+        else:
+            completion_times[i] = current_time
+    return completion_times
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("quantum", [1, 2, 5])
+def test_matches_slice_by_slice_reference(seed, quantum):
+    processes = workload(seed)
+    assert RR(quantum).schedule(processes).completion_times == reference_rr(processes, quantum)
+
+
+def test_arrivals_queue_ahead_of_the_preempted_process():
+    processes = [Process("A", 0, 5, 0), Process("B", 1, 3, 0)]
+    result = RR(2).schedule(processes)
+    assert result.timeline == [("A", 0, 2), ("B", 2, 4), ("A", 4, 6), ("B", 6, 7), ("A", 7, 8)]
+    assert result.completion_times == [8, 7]
+
+
+def test_lone_process_runs_to_the_quantum_boundary_after_the_next_arrival():
+    processes = [Process("A", 0, 10, 0), Process("B", 5, 2, 0), Process("C", 20, 1, 0)]
+    result = RR(2).schedule(processes)
+    assert result.timeline == [("A", 0, 6), ("B", 6, 8), ("A", 8, 12), ("Idle", 12, 20), ("C", 20, 21)]
+
+
+def test_quantum_must_be_positive():
+    with pytest.raises(ValueError):
+        RR(0).schedule([Process("A", 0, 1, 0)])
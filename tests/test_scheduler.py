@@ -0,0 +1,39 @@
+from fcfs import FCFS
+from process import Process
+from rr import RR
+from scheduler import RunningStats
+from workloads import workload
+
+
+def test_stats_of_a_small_run():
+    processes = [Process("A", 0, 4, 0), Process("B", 1, 2, 0), Process("C", 10, 3, 0)]
+    stats = FCFS().schedule(processes).stats
+    assert (stats.count, stats.busy_time, stats.span) == (3, 9, 13)
+    assert stats.throughput == 3 / 13
+    assert stats.utilization == 9 / 13
+    assert stats.idle_time == 4  # 6..10
+    assert stats.waiting.summary() == {"p50": 0, "p95": 3, "p99": 3, "max": 3}
+    assert stats.total_turnaround_time == 4 + 5 + 3
+
+
+def test_overhead_is_not_counted_as_idle():
+    processes = [Process("A", 0, 4, 0), Process("B", 0, 4, 0)]
+    stats = RR(2, switch_cost=1).schedule(processes).stats
+    assert stats.overhead_time == 3
+    assert stats.idle_time == 0
+
+
+def test_merged_shards_match_their_records():
+    shards = [FCFS().schedule(workload(seed)).stats for seed in range(3)]
+    combined = RunningStats(cpus=0)
+    for shard in shards:
+        combined.merge(shard)
+    assert combined.cpus == 3
+    assert combined.count == sum(shard.count for shard in shards)
+    assert combined.busy_time == sum(shard.busy_time for shard in shards)
+    assert combined.first_arrival == min(shard.first_arrival for shard in shards)
+    assert combined.makespan == max(shard.makespan for shard in shards)
+    assert combined.total_waiting_time == sum(shard.total_waiting_time for shard in shards)
+    # Utilization is measured against all three CPUs over the combined span
+    assert combined.utilization == combined.busy_time / (combined.span * 3)
+    assert combined.to_dict()["response_time"] == combined.response.summary()
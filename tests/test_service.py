@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import time
+
+from algorithms import create_scheduler
+from process import Process
+from service import SchedulingService
+from workloads import workload
+
+
+def as_json(processes):
+    return [{"name": p.name, "arrival_time": p.arrival_time, "burst_time": p.burst_time, "priority": p.priority}
+            for p in processes]
+
+
+async def request(port, method, path, body=None, headers=None):
+    """Send one request; return (status, JSON body or list of NDJSON lines)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = body if isinstance(body, bytes) else json.dumps(body).encode() if body is not None else b""
+    if headers is None:
+        headers = {"Content-Length": len(data)}
+    head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    writer.write(f"{method} {path} HTTP/1.1\r\n{head}\r\n".encode() + data)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, rest = raw.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    if b"chunked" not in head:
+        return status, json.loads(rest)
+    lines = b""
+    while True:
+        size, _, rest = rest.partition(b"\r\n")
+        size = int(size, 16)
+        if not size:
+            return status, [json.loads(line) for line in lines.splitlines()]
+        lines += rest[:size]
+        rest = rest[size + 2:]
+
+
+def serve(test, **options):
+    """Run test(service, port) against a fresh single-worker service."""
+    async def run():
+        service = SchedulingService(max_workers=1, **options)
+        server = await service.start("127.0.0.1", 0)
+        try:
+            await test(service, server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.close()
+
+    asyncio.run(run())
+
+
+def test_schedule_streams_the_same_result_as_a_direct_run():
+    processes = workload(5)
+
+    async def test(service, port):
+        status, lines = await request(port, "POST", "/schedule", {
+            "algorithm": "RR", "params": {"quantum_time": 3, "switch_cost": 1},
+            "processes": as_json(processes), "timeline": True})
+        assert status == 200
+        expected = create_scheduler("RR", quantum_time=3, switch_cost=1).schedule(processes)
+        assert lines[0]["type"] == "summary"
+        assert lines[0]["avg_waiting_time"] == expected.avg_waiting_time
+        assert lines[0]["context_switches"] == expected.context_switches
+        rows = [line for line in lines if line["type"] == "process"]
+        assert [(row["name"], row["completion_time"]) for row in rows] == \
+            [(processes[i].name, expected.completion_times[i]) for i in expected.finish_order]
+        slices = [(line["name"], line["start"], line["end"]) for line in lines if line["type"] == "slice"]
+        assert slices == expected.timeline
+        assert lines[-1] == {"type": "end"}
+        assert service.inflight == {} and os.listdir(service.output_dir.name) == []
+
+    serve(test)
+
+
+def test_schedule_reads_a_trace(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("name,arrival_time,burst_time,priority\nA,0,5,2\nB,1,3,1\n")
+
+    async def test(service, port):
+        status, lines = await request(port, "POST", "/schedule", {
+            "algorithm": "Priority", "params": {"preemptive": True}, "trace": str(path)})
+        assert status == 200
+        assert [(line["name"], line["completion_time"]) for line in lines if line["type"] == "process"] == \
+            [("B", 4), ("A", 8)]
+
+    serve(test)
+
+
+def test_bad_requests_get_400(tmp_path):
+    secret = tmp_path / "secret.csv"
+    secret.write_text("name,arrival_time,burst_time\nroot:x:0:0,zero,1\n")
+
+    async def test(service, port):
+        processes = as_json([Process("A", 0, 2, 0)])
+        for body in ({"algorithm": "Nope", "processes": processes},
+                     {"algorithm": "RR", "params": {"bogus": 1}, "processes": processes},
+                     {"algorithm": "RR", "params": {"quantum_time": "3"}, "processes": processes},
+                     {"processes": [{"name": "x"}]},
+                     {"trace": str(tmp_path / "missing.csv")},
+                     {"algorithm": "FCFS"},
+                     [1, 2],
+                     b"{not json"):
+            status, reply = await request(port, "POST", "/schedule", body)
+            assert status == 400, body
+            assert "error" in reply
+
+        status, reply = await request(port, "POST", "/schedule", {"trace": str(secret)})
+        assert status == 400
+        assert "line 2" in reply["error"]
+        assert "root" not in reply["error"]  # The trace's contents are not echoed back
+        assert service.buffered_bytes == 0
+
+    serve(test)
+
+
+def test_routing_and_upload_limits():
+    async def test(service, port):
+        assert (await request(port, "GET", "/nope"))[0] == 404
+        assert (await request(port, "POST", "/schedule", b"{}", headers={}))[0] == 411
+        status, reply = await request(port, "POST", "/schedule", {"processes": as_json(workload(1, count=200))})
+        assert status == 413
+        assert "100" in reply["error"]
+        assert service.buffered_bytes == 0
+
+    serve(test, max_upload_bytes=100)
+
+
+def test_broken_pool_is_a_server_error():
+    async def test(service, port):
+        service.executor.shutdown()
+        status, reply = await request(port, "POST", "/schedule", {"processes": as_json(workload(1))})
+        assert status == 500
+        assert service.inflight == {} and service.buffered_bytes == 0
+
+    serve(test)
+
+
+def test_identical_requests_share_one_simulation():
+    body = {"algorithm": "SRTF", "processes": as_json(workload(2)), "timeline": True}
+
+    async def test(service, port):
+        # Keep the only worker busy so that every request is in flight at once
+        loop = asyncio.get_running_loop()
+        busy = loop.run_in_executor(service.executor, time.sleep, 1)
+        replies = await asyncio.gather(*[request(port, "POST", "/schedule", body) for _ in range(6)])
+        await busy
+        assert all(status == 200 and lines == replies[0][1] for status, lines in replies)
+        assert (service.simulations, service.coalesced) == (1, 5)
+        status, health = await request(port, "GET", "/health")
+        assert health == {"status": "ok", "inflight": 0, "simulations": 1, "coalesced": 5}
+        assert os.listdir(service.output_dir.name) == []
+
+    serve(test, max_requests=6)
+
+
+def test_byte_budget_admits_one_upload_at_a_time_and_is_returned():
+    bodies = [{"algorithm": "FCFS", "processes": as_json(workload(seed, count=80))} for seed in range(6)]
+    budget = min(len(json.dumps(body)) for body in bodies)  # Room for a single upload
+
+    async def test(service, port):
+        peaks = []
+        reserve = service.reserve
+
+        async def tracked_reserve(length):
+            await reserve(length)
+            peaks.append(service.buffered_bytes)
+
+        service.reserve = tracked_reserve
+        replies = await asyncio.gather(*[request(port, "POST", "/schedule", body) for body in bodies])
+        assert [status for status, _ in replies] == [200] * len(bodies)
+        assert [len(lines) for _, lines in replies] == [len(body["processes"]) + 2 for body in bodies]
+        # A lone upload is let through even when it is over budget, but never two at once
+        assert max(peaks) <= max(len(json.dumps(body)) for body in bodies)
+        assert service.buffered_bytes == 0
+        assert service.simulations == len(bodies)
+
+    serve(test, max_buffered_bytes=budget)
@@ -0,0 +1,45 @@
+import pytest
+
+from algorithms import ALGORITHMS, create_scheduler
+from process import Process
+from traces import read_trace, write_csv_trace
+from workloads import CONFIGURATIONS, workload
+
+
+def by_arrival(processes):
+    return sorted(processes, key=lambda p: p.arrival_time)
+
+
+def test_every_algorithm_is_covered():
+    assert {algorithm for algorithm, _ in CONFIGURATIONS} == set(ALGORITHMS)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("algorithm, params", CONFIGURATIONS)
+def test_matches_run(seed, algorithm, params):
+    processes = workload(seed)
+    expected = create_scheduler(algorithm, **params).schedule(processes)
+    streamed = list(create_scheduler(algorithm, **params).stream(by_arrival(processes)))
+    assert [(record.name, record.completion_time, record.start_time) for record in streamed] == [
+        (processes[i].name, expected.completion_times[i], expected.start_times[i]) for i in expected.finish_order]
+
+
+def test_streams_a_trace_file_with_running_totals(tmp_path):
+    processes = by_arrival(workload(3, count=200))
+    path = tmp_path / "trace.csv"
+    write_csv_trace(path, processes)
+    expected = create_scheduler("RR", quantum_time=2).schedule(processes)
+
+    scheduler = create_scheduler("RR", quantum_time=2)
+    records = list(scheduler.stream(read_trace(path)))
+    assert [record.completion_time for record in records] == [
+        expected.completion_times[i] for i in expected.finish_order]
+    assert scheduler.stats.count == len(processes)
+    assert scheduler.stats.avg_waiting_time == pytest.approx(expected.avg_waiting_time)
+    assert scheduler.stats.avg_turnaround_time == pytest.approx(expected.avg_turnaround_time)
+
+
+def test_rejects_a_trace_out_of_arrival_order():
+    processes = [Process("A", 5, 1, 0), Process("B", 2, 1, 0)]
+    with pytest.raises(ValueError, match="not sorted"):
+        list(create_scheduler("FCFS").stream(processes))
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from algorithms import create_scheduler
+from process import Process
+from traces import is_binary_trace, open_binary_trace, read_trace, write_binary_trace, write_csv_trace
+from workloads import workload
+
+
+def rows(processes):
+    return [(p.name, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+
+def test_binary_round_trip(tmp_path):
+    pytest.importorskip("numpy")
+    processes = workload(5, count=300) + [Process("P0", 7, 3, -2), Process("Ünïcode", 2**40, 1, 2**31 - 1)]
+    path = tmp_path / "trace.bin"
+    write_binary_trace(path, iter(processes), chunk_size=16)
+    assert is_binary_trace(path)
+
+    table = open_binary_trace(path)
+    assert len(table) == len(processes)
+    assert rows(table) == rows(processes)
+    # Rows hand out plain ints, so results serialize like those of in-memory workloads
+    assert all(type(value) is int for row in rows(table) for value in row[1:])
+    json.dumps(rows(table))
+
+
+def test_binary_trace_schedules_like_the_original(tmp_path):
+    pytest.importorskip("numpy")
+    processes = workload(8, count=100)
+    path = tmp_path / "trace.bin"
+    write_binary_trace(path, processes)
+    expected = create_scheduler("Priority", preemptive=True).schedule(processes)
+    result = create_scheduler("Priority", preemptive=True).schedule(open_binary_trace(path))
+    assert result.completion_times == expected.completion_times
+    assert result.timeline == expected.timeline
+
+
+def test_empty_binary_trace(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "empty.bin"
+    write_binary_trace(path, [])
+    assert len(open_binary_trace(path)) == 0
+
+
+def test_binary_trace_is_read_only(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "trace.bin"
+    write_binary_trace(path, [Process("A", 0, 1, 0)])
+    with pytest.raises(TypeError):
+        open_binary_trace(path).append("B", 1, 1, 0)
+
+
+def test_text_traces_are_not_binary(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "trace.csv"
+    write_csv_trace(path, [Process("A", 0, 1, 0)])
+    assert not is_binary_trace(path)
+    with pytest.raises(ValueError):
+        open_binary_trace(path)
+
+
+def test_csv_and_jsonl_round_trip(tmp_path):
+    processes = workload(2, count=50)
+    csv_path = tmp_path / "trace.csv"
+    write_csv_trace(csv_path, processes)
+    jsonl_path = tmp_path / "trace.jsonl"
+    jsonl_path.write_text("".join(json.dumps({"name": p.name, "arrival_time": p.arrival_time,
+                                              "burst_time": p.burst_time, "priority": p.priority}) + "\n"
+                                  for p in processes))
+    assert rows(read_trace(csv_path)) == rows(processes)
+    assert rows(read_trace(jsonl_path)) == rows(processes)
+
+
+def test_bad_record_reports_its_line(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("name,arrival_time,burst_time,priority\nA,0,5,2\nB,x,3,1\n")
+    with pytest.raises(ValueError, match="line 3"):
+        list(read_trace(path))
@@ -0,0 +1,30 @@
+import random
+
+from process import Process
+
+# Every registered algorithm, with parameters that exercise its options
+CONFIGURATIONS = [
+    ("FCFS", {}),
+    ("FCFS", {"switch_cost": 1}),
+    ("RR", {"quantum_time": 1}),
+    ("RR", {"quantum_time": 3, "switch_cost": 1}),
+    ("Priority", {}),
+    ("Priority", {"preemptive": True}),
+    ("Priority", {"preemptive": True, "aging_interval": 3, "switch_cost": 1}),
+    ("SJF", {}),
+    ("SRTF", {"switch_cost": 1}),
+    ("MLFQ", {}),
+    ("MLFQ", {"quanta": (1, 3), "boost_interval": 20}),
+    ("CFS", {}),
+    ("CFS", {"switch_cost": 1}),
+    ("MultiCore", {"cores": 3}),
+    ("MultiCore", {"cores": 2, "discipline": "RR", "quantum_time": 2, "queue_mode": "per-core",
+                   "migration_cost": 1}),
+]
+
+
+def workload(seed, count=40, horizon=120):
+    """Random processes with arrival ties, idle gaps and repeated priorities."""
+    rng = random.Random(seed)
+    return [Process(f"P{i}", rng.randint(0, horizon), rng.randint(1, 9), rng.randint(0, 4))
+            for i in range(rng.randint(1, count))]
@@ -0,0 +1,181 @@
+import csv
+import json
+import struct
+
+from process import Process, ProcessTable, ProcessView
+
+TRACE_FIELDS = ("name", "arrival_time", "burst_time", "priority")
+
+
+def _to_process(record, line_number):
+    try:
+        return Process(record["name"], int(record["arrival_time"]), int(record["burst_time"]),
+                       int(record.get("priority") or 0))
+    except (KeyError, TypeError, ValueError) as e:
+        # Only the line number: traces may be files the caller could not otherwise read
+        raise ValueError(f"Invalid trace record on line {line_number}") from e
+
+
+def read_csv_trace(path):
+    """Yield Process objects from a CSV trace with a name,arrival_time,burst_time[,priority] header."""
+    with open(path, newline="") as f:
+        for line_number, record in enumerate(csv.DictReader(f), 2):
+            yield _to_process(record, line_number)
+
+
+def read_jsonl_trace(path):
+    """Yield Process objects from a JSON Lines trace, one object per line."""
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                yield _to_process(json.loads(line), line_number)
+
+
+def read_trace(path):
+    """Lazily read a CSV or JSONL trace, picking the format from the file extension."""
+    if str(path).endswith((".jsonl", ".ndjson")):
+        return read_jsonl_trace(path)
+    return read_csv_trace(path)
+
+
+def write_csv_trace(path, processes):
+    """Write processes as a CSV trace readable by read_csv_trace()."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(TRACE_FIELDS)
+        for process in processes:
+            writer.writerow((process.name, process.arrival_time, process.burst_time, process.priority))
+
+
+# Binary trace layout (little-endian):
+#   header  magic, record count, name count, offset of the name table
+#   records record count x (arrival_time int64, burst_time int64, priority int32, name_id uint32)
+#   names   (name count + 1) uint64 byte offsets into the UTF-8 blob that follows them
+BINARY_TRACE_MAGIC = b"CPUTRC01"
+_HEADER = struct.Struct("<8sQQQ")
+_RECORD = struct.Struct("<qqiI")
+_RECORD_DTYPE = [("arrival_time", "<i8"), ("burst_time", "<i8"), ("priority", "<i4"), ("name_id", "<u4")]
+
+
+def write_binary_trace(path, processes, chunk_size=65536):
+    """Write processes (any iterable) as a fixed-width binary trace; repeated names share one name id."""
+    name_ids = {}
+    count = 0
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(BINARY_TRACE_MAGIC, 0, 0, 0))
+        chunk = []
+        for process in processes:
+            name_id = name_ids.setdefault(process.name, len(name_ids))
+            chunk.append(_RECORD.pack(process.arrival_time, process.burst_time, process.priority, name_id))
+            if len(chunk) >= chunk_size:
+                f.write(b"".join(chunk))
+                chunk.clear()
+            count += 1
+        f.write(b"".join(chunk))
+
+        names_offset = f.tell()
+        encoded = [str(name).encode("utf-8") for name in name_ids]
+        offsets = [0]
+        for name in encoded:
+            offsets.append(offsets[-1] + len(name))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(b"".join(encoded))
+
+        f.seek(0)
+        f.write(_HEADER.pack(BINARY_TRACE_MAGIC, count, len(name_ids), names_offset))
+
+
+class TraceNames:
+    """Read-only sequence of process names decoded on access from a mapped name table."""
+
+    def __init__(self, name_ids, offsets, blob):
+        self.name_ids = name_ids
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.name_ids)
+
+    def __getitem__(self, index):
+        name_id = int(self.name_ids[index])
+        return bytes(self.blob[int(self.offsets[name_id]):int(self.offsets[name_id + 1])]).decode("utf-8")
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class MappedProcessView(ProcessView):
+    """Row of a MappedProcessTable that reads plain ints, not NumPy scalars, out of the mapped columns."""
+    __slots__ = ()
+
+    @property
+    def arrival_time(self):
+        return int(self.table.arrival_time[self.index])
+
+    @property
+    def burst_time(self):
+        return int(self.table.burst_time[self.index])
+
+    @property
+    def priority(self):
+        return int(self.table.priority[self.index])
+
+    @property
+    def remaining_time(self):
+        return int(self.table.remaining_time[self.index])
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining_time[self.index] = value
+
+
+class MappedProcessTable(ProcessTable):
+    """
+    ProcessTable over a memory-mapped binary trace.
+    Columns are zero-copy, read-only NumPy views of the file, so opening is
+    near-instant regardless of size and concurrent readers share the OS page cache.
+    remaining_time is materialized (as a private copy) only when first touched.
+    """
+    row_type = MappedProcessView
+
+    def __init__(self, path):
+        import numpy as np
+
+        with open(path, "rb") as f:
+            magic, count, name_count, names_offset = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != BINARY_TRACE_MAGIC:
+            raise ValueError(f"{path} is not a binary process trace")
+
+        self.path = path
+        self.records = np.memmap(path, dtype=_RECORD_DTYPE, mode="r", offset=_HEADER.size, shape=(count,)) \
+            if count else np.zeros(0, dtype=_RECORD_DTYPE)
+        self.arrival_time = self.records["arrival_time"]
+        self.burst_time = self.records["burst_time"]
+        self.priority = self.records["priority"]
+        offsets = np.memmap(path, dtype="<u8", mode="r", offset=names_offset, shape=(name_count + 1,))
+        blob_offset = names_offset + offsets.nbytes
+        blob = np.memmap(path, dtype="u1", mode="r", offset=blob_offset, shape=(int(offsets[-1]),)) \
+            if offsets[-1] else b""
+        self.names = TraceNames(self.records["name_id"], offsets, blob)
+        self._remaining_time = None
+
+    @property
+    def remaining_time(self):
+        if self._remaining_time is None:
+            self._remaining_time = self.burst_time.copy()
+        return self._remaining_time
+
+    def append(self, name, arrival_time, burst_time, priority):
+        raise TypeError("Memory-mapped traces are read-only")
+
+
+def is_binary_trace(path):
+    """True if path starts with the binary trace magic."""
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_TRACE_MAGIC)) == BINARY_TRACE_MAGIC
+
+
+def open_binary_trace(path):
+    """Memory-map a binary trace written by write_binary_trace() as a MappedProcessTable."""
+    return MappedProcessTable(path)